@@ -3,15 +3,25 @@
 Room Finder Application
 -----------------------
 A tool to find vacant rooms on campus.
+
+Run without arguments for the GUI, or with a command (see --help) for the
+command-line interface.
 """
 
+import sys
 import tkinter as tk
 
+from src import cli
 from src.gui.simple_gui import RoomFinderGUI
+from src.utils.logging_setup import configure_logging
 
 
 def main():
     """Main entry point for the application"""
+    if len(sys.argv) > 1:
+        sys.exit(cli.main(sys.argv[1:]))
+
+    configure_logging()
     root = tk.Tk()
     app = RoomFinderGUI(root)
     root.mainloop()
@@ -0,0 +1,346 @@
+"""
+Command-line interface for the room finder.
+
+Usage:
+    python main.py export --term 20252 --days MW -o free_rooms.csv
+    python main.py conflicts --term 20252 -o conflicts.csv
+    python main.py where --instructor "Smith, Jane" --term 20252 --days TR --at 11:00
+    python main.py near --department MATH --term 20252 --days MW
+    python main.py memory
+    python main.py answers --term 20252
+    python main.py diff data/old_data.csv data/new_data.csv --term 20252
+    python main.py --grid standard export --term 20253 --days TR -o standard.csv
+    python main.py grids
+    python main.py -v memory    (-v shows info messages, -vv debug messages)
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from datetime import date
+from typing import List, Optional, Tuple
+
+from src.core.answer_table import ALL_COMBINATIONS, AnswerTable, combination_days
+from src.core.block_grids import BlockGrid, get_grid, grid_config, grid_for
+from src.core.conflicts import (
+    find_conflicts,
+    summarize_conflicts,
+    write_conflict_report,
+)
+from src.core.constants.my_rooms import MY_ROOMS
+from src.core.export_diff import diff_export_files, format_diff_report
+from src.core.exporters import EXPORT_FORMATS, export_rows, iter_slot_rows, write_stream
+from src.core.room_finder import build_occupied_slots, load_schedule
+from src.core.schedule_index import (
+    ScheduleIndex,
+    free_rooms_near,
+    instructor_schedule_at,
+)
+from src.core.schedule_store import memory_usage_mb
+from src.core.validation import DAY_CODES
+from src.utils.logging_setup import configure_logging
+
+
+def day_codes(value: str) -> str:
+    """argparse type for a string of day codes such as 'MWF'"""
+    value = value.upper()
+    if not value or any(day not in DAY_CODES for day in value):
+        raise argparse.ArgumentTypeError(f"days must be made of {DAY_CODES}")
+    return value
+
+
+def term_grid(args: argparse.Namespace, term: int) -> BlockGrid:
+    """The grid chosen with --grid, or the term's own grid"""
+    return get_grid(args.grid) if args.grid else grid_for(term)
+
+
+def run_export(args: argparse.Namespace) -> int:
+    """Export availability for a term to a file or stdout"""
+    schedule = load_schedule(args.data_file)
+    occupied_slots = build_occupied_slots(schedule, args.term)
+    rooms = None if args.all_rooms else MY_ROOMS
+    blocks = term_grid(args, args.term).blocks
+    rows = iter_slot_rows(occupied_slots, args.days, rooms, blocks)
+
+    if args.output == "-":
+        count = write_stream(
+            rows, sys.stdout, args.format or "csv", args.start, args.until
+        )
+    else:
+        count = export_rows(rows, args.output, args.format, args.start, args.until)
+    print(f"Exported {count} rows", file=sys.stderr)
+    return 0
+
+
+def run_conflicts(args: argparse.Namespace) -> int:
+    """Report rooms booked by more than one section at the same time"""
+    schedule = load_schedule(args.data_file)
+    conflicts = find_conflicts(schedule, args.term, use_dates=not args.ignore_dates)
+    write_conflict_report(conflicts, args.output)
+
+    print(f"Found {len(conflicts)} double bookings, written to {args.output}")
+    if not conflicts.empty:
+        print(summarize_conflicts(conflicts).to_string(index=False))
+    return 0
+
+
+def run_where(args: argparse.Namespace) -> int:
+    """Show where an instructor is teaching at a given time"""
+    index = ScheduleIndex(load_schedule(args.data_file))
+    sections = instructor_schedule_at(
+        index, args.instructor, args.term, args.days, args.at
+    )
+    if not sections:
+        print(f"{args.instructor} is not teaching at {args.at} on {args.days}")
+    for section in sections:
+        print(
+            f"Building {section['building']}, Room {section['room']}: "
+            f"{section['course_id']} {section['days']} "
+            f"{section['start_time']}-{section['end_time']}"
+        )
+    return 0
+
+
+def run_near(args: argparse.Namespace) -> int:
+    """List free rooms in the buildings a department already teaches in"""
+    schedule = load_schedule(args.data_file)
+    index = ScheduleIndex(schedule)
+    occupied_slots = build_occupied_slots(schedule, args.term)
+    free = free_rooms_near(
+        index,
+        args.department,
+        args.term,
+        args.days,
+        occupied_slots,
+        term_grid(args, args.term).blocks,
+    )
+    for (start, end), rooms in free.items():
+        listed = ", ".join(f"{building}-{room}" for building, room in rooms)
+        print(f"{start}-{end}: {listed or '(none)'}")
+    return 0
+
+
+def traced_load(data_file: str, compact: bool) -> Tuple[float, float, float, int]:
+    """
+    Load the schedule while tracing the memory the process allocates.
+
+    tracemalloc sees every allocation made through Python and NumPy, so
+    unlike the DataFrame's own estimate it also counts what parsing
+    leaves behind, and it works the same on Windows and Linux.
+
+    Returns:
+        Tuple of the MB still held with the schedule loaded, the peak MB
+        while loading, the schedule's deep size in MB and its row count
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        schedule = load_schedule(data_file, compact=compact)
+        held, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return held / 2**20, peak / 2**20, memory_usage_mb(schedule), len(schedule)
+
+
+def run_memory(args: argparse.Namespace) -> int:
+    """Compare the memory a validated and a compact schedule load holds"""
+    # Warm up imports and caches so neither measurement pays for them
+    load_schedule(args.data_file, compact=True)
+    held_before, peak_before, size_before, rows = traced_load(args.data_file, False)
+    held_after, peak_after, size_after, _ = traced_load(args.data_file, True)
+
+    print(f"Rows:                 {rows}")
+    print(f"{'':22}{'validated':>12}{'compact':>12}")
+    for label, before, after in [
+        ("Memory held", held_before, held_after),
+        ("Peak while loading", peak_before, peak_after),
+        ("DataFrame size", size_before, size_after),
+    ]:
+        print(
+            f"{label + ':':22}{before:>9.1f} MB{after:>9.1f} MB ({after / before:.0%})"
+        )
+    return 0
+
+
+def run_answers(args: argparse.Namespace) -> int:
+    """Report the memory/time tradeoff of the day-combination answer table"""
+    schedule = load_schedule(args.data_file)
+    occupied_slots = build_occupied_slots(schedule, args.term)
+    rooms = (
+        sorted(tuple(map(int, key.split("-"))) for key in occupied_slots)
+        if args.all_rooms
+        else MY_ROOMS
+    )
+    combinations = [combination_days(key) for key in ALL_COMBINATIONS]
+    blocks = term_grid(args, args.term).blocks
+
+    lazy = AnswerTable(occupied_slots, rooms, blocks=blocks)
+    single_days = lazy.report()
+    started = time.perf_counter()
+    for days in combinations:
+        lazy.lookup(days)
+    cold_us = (time.perf_counter() - started) / len(combinations) * 1e6
+
+    started = time.perf_counter()
+    for days in combinations:
+        lazy.lookup(days)
+    warm_us = (time.perf_counter() - started) / len(combinations) * 1e6
+
+    full = AnswerTable(occupied_slots, rooms, precompute=True, blocks=blocks).report()
+    print(f"Rooms:                      {full['rooms']}")
+    print(f"Time blocks:                {full['blocks']}")
+    print(
+        f"Single-day table:           {single_days['memory_kb']:.1f} KB, "
+        f"built in {single_days['build_ms']:.1f} ms"
+    )
+    print(
+        f"All {full['combinations_total']} combinations:        "
+        f"{full['memory_kb']:.1f} KB, +{full['precompute_ms']:.2f} ms to precompute"
+    )
+    print(f"Lookup, lazily filled:      {cold_us:.1f} us")
+    print(f"Lookup, already filled:     {warm_us:.1f} us")
+    return 0
+
+
+def run_diff(args: argparse.Namespace) -> int:
+    """Report MY_ROOMS blocks that changed between two exports"""
+    started = time.perf_counter()
+    grid = get_grid(args.grid) if args.grid else None
+    diff = diff_export_files(args.old, args.new, args.term, grid=grid)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    print("\n".join(format_diff_report(diff)))
+    # Includes loading; an export not seen before is parsed once, then cached
+    print(f"\n{len(diff)} changed blocks in {elapsed_ms:.1f} ms")
+    if args.output:
+        diff.to_csv(args.output, index=False)
+    return 0
+
+
+def run_grids(args: argparse.Namespace) -> int:
+    """List the time block grids and which terms and sessions use them"""
+    config = grid_config()
+    for name, grid in config.grids.items():
+        blocks = ", ".join(f"{start}-{end}" for start, end in grid.blocks)
+        print(f"{name}{' (default)' if name == config.default else ''}: {blocks}")
+    for label, rules in [
+        ("Term", config.terms),
+        ("Session", config.sessions),
+        ("Terms ending in", config.term_suffixes),
+    ]:
+        for key, name in rules.items():
+            print(f"{label} {key}: {name}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="main.py", description="Find vacant rooms")
+    parser.add_argument(
+        "--data-file",
+        default="*data*.csv",
+        help="export file or glob pattern, relative to the data directory",
+    )
+    parser.add_argument(
+        "--grid",
+        choices=sorted(grid_config().grids),
+        help="time block grid to use (default: the term's own grid)",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="count",
+        default=0,
+        help="show info messages on the console; repeat for debug messages",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="export room availability")
+    export.add_argument("--term", type=int, required=True)
+    export.add_argument("--days", type=day_codes, default=DAY_CODES)
+    export.add_argument(
+        "-o", "--output", required=True, help="output file, or - for stdout"
+    )
+    export.add_argument(
+        "--format",
+        choices=EXPORT_FORMATS,
+        help="output format (default: from the file extension)",
+    )
+    export.add_argument(
+        "--all-rooms",
+        action="store_true",
+        help="export every scheduled room instead of MY_ROOMS",
+    )
+    export.add_argument(
+        "--start",
+        type=date.fromisoformat,
+        help="first date for .ics events (default: today)",
+    )
+    export.add_argument(
+        "--until", type=date.fromisoformat, help="last date for .ics events"
+    )
+    export.set_defaults(handler=run_export)
+
+    conflicts = commands.add_parser(
+        "conflicts", help="report rooms booked by overlapping sections"
+    )
+    conflicts.add_argument("--term", type=int, help="term to check (default: all)")
+    conflicts.add_argument("-o", "--output", required=True, help="CSV report file")
+    conflicts.add_argument(
+        "--ignore-dates",
+        action="store_true",
+        help="flag time overlaps even when the sections' date ranges do not meet",
+    )
+    conflicts.set_defaults(handler=run_conflicts)
+
+    where = commands.add_parser("where", help="find where an instructor teaches")
+    where.add_argument("--instructor", required=True)
+    where.add_argument("--term", type=int, required=True)
+    where.add_argument("--days", type=day_codes, required=True)
+    where.add_argument("--at", required=True, help="time of day as HH:MM")
+    where.set_defaults(handler=run_where)
+
+    near = commands.add_parser(
+        "near", help="free rooms in buildings a department teaches in"
+    )
+    near.add_argument("--department", required=True)
+    near.add_argument("--term", type=int, required=True)
+    near.add_argument("--days", type=day_codes, required=True)
+    near.set_defaults(handler=run_near)
+
+    memory = commands.add_parser(
+        "memory", help="compare the memory a compact schedule load holds"
+    )
+    memory.set_defaults(handler=run_memory)
+
+    answers = commands.add_parser(
+        "answers", help="report the day-combination answer table's cost"
+    )
+    answers.add_argument("--term", type=int, required=True)
+    answers.add_argument(
+        "--all-rooms",
+        action="store_true",
+        help="index every scheduled room instead of MY_ROOMS",
+    )
+    answers.set_defaults(handler=run_answers)
+
+    diff = commands.add_parser(
+        "diff", help="report MY_ROOMS blocks that changed between two exports"
+    )
+    diff.add_argument("old", help="previous export")
+    diff.add_argument("new", help="new export")
+    diff.add_argument("--term", type=int, help="term to compare (default: all)")
+    diff.add_argument("-o", "--output", help="also write the changes to a CSV file")
+    diff.set_defaults(handler=run_diff)
+
+    grids = commands.add_parser("grids", help="list the time block grids")
+    grids.set_defaults(handler=run_grids)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    configure_logging(args.verbose)
+    return args.handler(args)
@@ -0,0 +1,133 @@
+import sys
+import time
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from src.core.constants.my_rooms import MY_ROOMS
+from src.core.constants.time_blocks import TIME_BLOCKS
+from src.core.room_finder import vacancy_mask
+from src.core.validation import DAY_CODES, to_minutes
+
+# Every non-empty combination of the six day checkboxes
+ALL_COMBINATIONS = range(1, 2 ** len(DAY_CODES))
+
+
+def combination_key(days: Iterable[str]) -> int:
+    """Encode a set of day codes as a bitmask, bit i for DAY_CODES[i]"""
+    key = 0
+    for day in days:
+        key |= 1 << DAY_CODES.index(day)
+    return key
+
+
+def combination_days(key: int) -> str:
+    """Decode a combination bitmask back into its day codes"""
+    return "".join(day for i, day in enumerate(DAY_CODES) if key >> i & 1)
+
+
+class AnswerTable:
+    """
+    Free rooms per time block for every day combination of one term.
+
+    Each table covers one block grid, so a term searched on several grids
+    gets one table per grid over the same occupancy. Each answer is a
+    tuple with one bitset per block of that grid, where bit i is
+    set when rooms[i] is free on all days of the combination. The six
+    single-day rows are built up front; other combinations are filled on
+    first use, or all 63 at once with precompute_all(). Any combination is
+    one AND away from a smaller one that is already filled, so filling
+    costs one integer AND per block.
+    """
+
+    def __init__(
+        self,
+        occupied_slots: Dict[str, Dict[str, List[Tuple[int, int]]]],
+        rooms: Iterable[Tuple[int, int]] = MY_ROOMS,
+        precompute: bool = False,
+        blocks: Sequence[Tuple[str, str]] = TIME_BLOCKS,
+    ):
+        started = time.perf_counter()
+        self.rooms = list(rooms)
+        self.blocks = list(blocks)
+        block_minutes = [
+            (to_minutes(start), to_minutes(end)) for start, end in self.blocks
+        ]
+
+        self.answers: Dict[int, Tuple[int, ...]] = {}
+        for day in DAY_CODES:
+            per_block = [0] * len(self.blocks)
+            for bit, (building, room) in enumerate(self.rooms):
+                occupied = occupied_slots.get(f"{building}-{room}", {}).get(day, ())
+                mask = vacancy_mask(occupied, block_minutes)
+                for i in range(len(self.blocks)):
+                    if mask >> i & 1:
+                        per_block[i] |= 1 << bit
+            self.answers[combination_key(day)] = tuple(per_block)
+        self.build_seconds = time.perf_counter() - started
+
+        self.precompute_seconds = 0.0
+        if precompute:
+            self.precompute_all()
+
+    def _fill(self, key: int) -> Tuple[int, ...]:
+        """Compute a combination from its lowest day and the remaining days"""
+        lowest = key & -key
+        rest = key ^ lowest
+        if rest and rest not in self.answers:
+            self._fill(rest)
+        if rest:
+            self.answers[key] = tuple(
+                a & b for a, b in zip(self.answers[lowest], self.answers[rest])
+            )
+        return self.answers[key]
+
+    def precompute_all(self) -> None:
+        """Fill every day combination now instead of on first use"""
+        started = time.perf_counter()
+        # Increasing order means every smaller combination is already filled
+        for key in ALL_COMBINATIONS:
+            if key not in self.answers:
+                self._fill(key)
+        self.precompute_seconds = time.perf_counter() - started
+
+    def lookup(self, days: Iterable[str]) -> Tuple[int, ...]:
+        """
+        Room bitsets per time block for rooms free on all the given days.
+
+        Raises:
+            ValueError: If no days are given
+        """
+        key = combination_key(days)
+        if not key:
+            raise ValueError("Select at least one day")
+        answer = self.answers.get(key)
+        if answer is None:
+            answer = self._fill(key)
+        return answer
+
+    def free_rooms(
+        self, days: Iterable[str]
+    ) -> Dict[Tuple[str, str], List[Tuple[int, int]]]:
+        """Decode lookup() into the free (building, room) pairs per time block"""
+        return {
+            block: [room for bit, room in enumerate(self.rooms) if bits >> bit & 1]
+            for block, bits in zip(self.blocks, self.lookup(days))
+        }
+
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the filled answers"""
+        return sys.getsizeof(self.answers) + sum(
+            sys.getsizeof(answer) + sum(sys.getsizeof(bits) for bits in answer)
+            for answer in self.answers.values()
+        )
+
+    def report(self) -> Dict[str, float]:
+        """Memory and time figures for choosing between lazy and full fill"""
+        return {
+            "rooms": len(self.rooms),
+            "blocks": len(self.blocks),
+            "combinations_filled": len(self.answers),
+            "combinations_total": len(ALL_COMBINATIONS),
+            "memory_kb": self.memory_bytes() / 1024,
+            "build_ms": self.build_seconds * 1000,
+            "precompute_ms": self.precompute_seconds * 1000,
+        }
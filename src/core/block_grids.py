@@ -0,0 +1,165 @@
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+from src.core.constants.time_blocks import TIME_BLOCKS
+from src.core.validation import to_minutes
+
+# Grids other than the standard one, and which terms or sessions use them.
+# Ships empty; block_grids.example.json shows the format with made-up grids
+GRIDS_FILE = Path(__file__).resolve().parent / "block_grids.json"
+
+# Built from TIME_BLOCKS, so the fall/spring grid has a single definition
+STANDARD_GRID = "standard"
+
+# Occupancy masks over a grid are uint32, one bit per block
+MAX_BLOCKS = 32
+
+
+class BlockGrid(NamedTuple):
+    """A named slot pattern; bit i of any mask over it stands for blocks[i]"""
+
+    name: str
+    blocks: Tuple[Tuple[str, str], ...]
+    minutes: Tuple[Tuple[int, int], ...]
+
+
+def make_grid(name: str, blocks: Iterable[Tuple[str, str]]) -> BlockGrid:
+    """
+    Build a grid from "HH:MM" block pairs.
+
+    Raises:
+        ValueError: If the grid is empty, has more blocks than a mask holds,
+            or a block does not end after it starts
+    """
+    blocks = tuple((start, end) for start, end in blocks)
+    if not blocks:
+        raise ValueError(f"Grid '{name}' has no time blocks")
+    if len(blocks) > MAX_BLOCKS:
+        raise ValueError(
+            f"Grid '{name}' has {len(blocks)} time blocks, at most {MAX_BLOCKS} "
+            "are supported"
+        )
+    minutes = tuple((to_minutes(start), to_minutes(end)) for start, end in blocks)
+    for start_min, end_min in minutes:
+        if not start_min < end_min:
+            raise ValueError(f"Grid '{name}' has a block ending before it starts")
+    return BlockGrid(name, blocks, minutes)
+
+
+class GridConfig:
+    """
+    Every known grid and the rules that pick one for a term.
+
+    A term uses, in order of precedence, the grid named for the term
+    itself, for its session, or for the last digit of its code (the
+    registrar's semester digit), and the default grid otherwise.
+    """
+
+    def __init__(
+        self,
+        grids: Dict[str, BlockGrid],
+        default: str = STANDARD_GRID,
+        terms: Optional[Dict[str, str]] = None,
+        sessions: Optional[Dict[str, str]] = None,
+        term_suffixes: Optional[Dict[str, str]] = None,
+    ):
+        self.grids = grids
+        self.default = default
+        self.terms = terms or {}
+        self.sessions = sessions or {}
+        self.term_suffixes = term_suffixes or {}
+
+        # Fail on load rather than on the first search that hits a bad rule
+        for rules in (self.terms, self.sessions, self.term_suffixes):
+            for name in rules.values():
+                self.get(name)
+        self.get(default)
+
+    def get(self, name: str) -> BlockGrid:
+        """
+        Look up a grid by name.
+
+        Raises:
+            KeyError: If no grid has that name
+        """
+        if name not in self.grids:
+            raise KeyError(f"Unknown time block grid '{name}'")
+        return self.grids[name]
+
+    def grid_for(self, term: int, session: Optional[str] = None) -> BlockGrid:
+        """
+        Pick the grid a term (and optionally a session) is scheduled on.
+
+        Args:
+            term: Term code such as 20253
+            session: Session code, if the query is for one session
+
+        Returns:
+            BlockGrid: The grid to search and index the term with
+        """
+        term = str(term)
+        if term in self.terms:
+            return self.get(self.terms[term])
+        if session is not None and str(session) in self.sessions:
+            return self.get(self.sessions[str(session)])
+        if term[-1:] in self.term_suffixes:
+            return self.get(self.term_suffixes[term[-1:]])
+        return self.get(self.default)
+
+
+def load_grid_config(grids_file: Path = GRIDS_FILE) -> GridConfig:
+    """
+    Read the grid definitions, falling back to just the standard grid.
+
+    The file holds "grids", mapping a name to a list of ["HH:MM", "HH:MM"]
+    blocks, and the rules "terms", "sessions" and "term_suffixes", each
+    mapping a term code, session code or last term digit to a grid name.
+    "default" names the grid used when no rule applies.
+
+    Args:
+        grids_file: JSON file with "grids" and the term/session rules
+
+    Returns:
+        GridConfig: The standard grid plus every grid defined in the file
+
+    Raises:
+        ValueError: If a grid is malformed or a rule names an unknown grid
+    """
+    try:
+        with open(grids_file, "r") as f:
+            config = json.load(f)
+    except FileNotFoundError:
+        config = {}
+
+    grids = {STANDARD_GRID: make_grid(STANDARD_GRID, TIME_BLOCKS)}
+    for name, blocks in config.get("grids", {}).items():
+        grids[name] = make_grid(name, blocks)
+
+    try:
+        return GridConfig(
+            grids,
+            config.get("default", STANDARD_GRID),
+            config.get("terms"),
+            config.get("sessions"),
+            config.get("term_suffixes"),
+        )
+    except KeyError as e:
+        raise ValueError(f"{grids_file}: {e.args[0]}") from None
+
+
+@lru_cache(maxsize=None)
+def grid_config() -> GridConfig:
+    """The grid configuration from GRIDS_FILE, read once per process"""
+    return load_grid_config()
+
+
+def grid_for(term: int, session: Optional[str] = None) -> BlockGrid:
+    """Grid for a term from the shared configuration, see GridConfig.grid_for"""
+    return grid_config().grid_for(term, session)
+
+
+def get_grid(name: str) -> BlockGrid:
+    """Grid by name from the shared configuration, see GridConfig.get"""
+    return grid_config().get(name)
@@ -0,0 +1,180 @@
+import heapq
+import logging
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from src.core.validation import DAY_CODES, minutes_to_time
+
+logger = logging.getLogger(__name__)
+
+ROOM_DAY_COLUMNS = ["term", "building", "room_number", "day"]
+
+CONFLICT_COLUMNS = [
+    "term",
+    "building",
+    "room",
+    "day",
+    "reference_a",
+    "course_a",
+    "time_a",
+    "reference_b",
+    "course_b",
+    "time_b",
+    "overlap_start",
+    "overlap_end",
+    "overlap_minutes",
+]
+
+
+def explode_meetings(schedule: pd.DataFrame) -> pd.DataFrame:
+    """
+    Turn validated sections into one row per room and meeting day.
+
+    Args:
+        schedule: Validated schedule rows from load_schedule
+
+    Returns:
+        pd.DataFrame: Copy of the rows with a single-letter ``day`` column
+    """
+    parts = [
+        schedule[schedule["days"].str.contains(day, regex=False)].assign(day=day)
+        for day in DAY_CODES
+    ]
+    return pd.concat(parts, ignore_index=True)
+
+
+def date_bounds(meetings: pd.DataFrame) -> tuple:
+    """
+    Start and end dates as integer day numbers for cheap comparison.
+
+    Missing or unparseable dates are treated as open-ended, so a section
+    without dates is assumed to run for the whole term.
+    """
+    lowest = np.iinfo(np.int64).min
+    highest = np.iinfo(np.int64).max
+    if "start_date" not in meetings or "end_date" not in meetings:
+        return (
+            np.full(len(meetings), lowest, dtype=np.int64),
+            np.full(len(meetings), highest, dtype=np.int64),
+        )
+
+    def as_days(column: str, missing: int) -> np.ndarray:
+        dates = pd.to_datetime(meetings[column], format="%Y-%m-%d", errors="coerce")
+        days = dates.to_numpy(dtype="datetime64[D]").astype(np.int64)
+        return np.where(dates.isna().to_numpy(), missing, days)
+
+    return as_days("start_date", lowest), as_days("end_date", highest)
+
+
+def find_conflicts(
+    schedule: pd.DataFrame, term: Optional[int] = None, use_dates: bool = True
+) -> pd.DataFrame:
+    """
+    Find every pair of sections booked into the same room at overlapping times.
+
+    Meetings are sorted by room, day and start time and then swept once,
+    keeping a heap of the meetings still in progress. Each new meeting is
+    compared only against that heap, so the cost is O(n log n) plus the
+    number of conflicts instead of comparing every pair.
+
+    Args:
+        schedule: Validated schedule rows from load_schedule
+        term: Only check this term; checks every term if omitted
+        use_dates: Also require the sections' date ranges to overlap, so
+            back-to-back sessions sharing a room are not reported
+
+    Returns:
+        pd.DataFrame: One row per conflicting pair, see CONFLICT_COLUMNS
+    """
+    if term is not None:
+        schedule = schedule[schedule["term"] == term]
+
+    meetings = explode_meetings(schedule).sort_values(
+        ROOM_DAY_COLUMNS + ["start_min"], ignore_index=True
+    )
+    group = meetings.groupby(ROOM_DAY_COLUMNS, sort=False).ngroup().to_numpy()
+    starts = meetings["start_min"].to_numpy()
+    ends = meetings["end_min"].to_numpy()
+    first_days, last_days = date_bounds(meetings)
+    if "reference_number" in meetings:
+        references = meetings["reference_number"].to_numpy()
+    else:
+        references = np.arange(len(meetings))
+
+    earlier, later = [], []
+    active = []  # heap of (end_min, row) still running at the current start
+    current_group = -1
+    for i in range(len(meetings)):
+        if group[i] != current_group:
+            current_group = group[i]
+            active = []
+        while active and active[0][0] <= starts[i]:
+            heapq.heappop(active)
+        for _, j in active:
+            if references[i] == references[j]:
+                continue  # same section listed twice
+            if use_dates and not (
+                first_days[i] <= last_days[j] and last_days[i] >= first_days[j]
+            ):
+                continue
+            earlier.append(j)
+            later.append(i)
+        heapq.heappush(active, (ends[i], i))
+
+    logger.info(
+        "Found room conflicts",
+        extra={"fields": {"conflicts": len(earlier), "meetings": len(meetings)}},
+    )
+    return conflict_frame(meetings, earlier, later)
+
+
+def conflict_frame(meetings: pd.DataFrame, earlier: list, later: list) -> pd.DataFrame:
+    """Build the report rows for the conflicting (earlier, later) row pairs"""
+    a = meetings.iloc[earlier].reset_index(drop=True)
+    b = meetings.iloc[later].reset_index(drop=True)
+    courses_a = a["course_id"] if "course_id" in a else pd.Series([""] * len(a))
+    courses_b = b["course_id"] if "course_id" in b else pd.Series([""] * len(b))
+    overlap_start = np.maximum(a["start_min"], b["start_min"])
+    overlap_end = np.minimum(a["end_min"], b["end_min"])
+
+    return pd.DataFrame(
+        {
+            "term": a["term"],
+            "building": a["building"],
+            "room": a["room_number"],
+            "day": a["day"],
+            "reference_a": a.get("reference_number", pd.Series(earlier)),
+            "course_a": courses_a,
+            "time_a": a["start_time"].astype(str) + "-" + a["end_time"].astype(str),
+            "reference_b": b.get("reference_number", pd.Series(later)),
+            "course_b": courses_b,
+            "time_b": b["start_time"].astype(str) + "-" + b["end_time"].astype(str),
+            "overlap_start": overlap_start.map(minutes_to_time),
+            "overlap_end": overlap_end.map(minutes_to_time),
+            "overlap_minutes": (overlap_end - overlap_start).astype(int),
+        },
+        columns=CONFLICT_COLUMNS,
+    )
+
+
+def summarize_conflicts(conflicts: pd.DataFrame) -> pd.DataFrame:
+    """Count conflicts and affected rooms per building"""
+    return (
+        conflicts.groupby("building")
+        .agg(conflicts=("room", "size"), rooms=("room", "nunique"))
+        .reset_index()
+    )
+
+
+def write_conflict_report(conflicts: pd.DataFrame, output: Path) -> None:
+    """Write conflicts sorted by building, room and day to a CSV report"""
+    conflicts.sort_values(["term", "building", "room", "day"]).to_csv(
+        output, index=False
+    )
+    logger.info(
+        "Wrote conflict report",
+        extra={"fields": {"conflicts": len(conflicts), "file": output}},
+    )
@@ -0,0 +1,298 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.core.block_grids import BlockGrid, grid_config, grid_for
+from src.core.constants.my_rooms import MY_ROOMS
+from src.core.constants.time_blocks import TIME_BLOCKS
+from src.core.room_finder import DATA_DIR, data_file_version, load_schedule
+from src.core.validation import DAY_CODES, to_minutes
+
+DIFF_COLUMNS = ["term", "building", "room", "day", "start", "end", "change"]
+
+# Occupancy bits of each export already diffed, see export_bits
+CACHE_DIR = DATA_DIR / "cache"
+
+
+def busy_bits(
+    schedule: pd.DataFrame,
+    terms: Sequence[int],
+    rooms: Sequence[Tuple[int, int]],
+    blocks: Sequence[Tuple[str, str]] = TIME_BLOCKS,
+) -> np.ndarray:
+    """
+    Occupancy of the given rooms as bitmasks, built without a Python row loop.
+
+    Args:
+        schedule: Validated schedule rows from load_schedule
+        terms: Terms to build, in the order of the first axis
+        rooms: (building, room) pairs, in the order of the second axis
+        blocks: Time blocks; bit i stands for blocks[i]
+
+    Returns:
+        np.ndarray: uint32 array of shape (terms, rooms, days) with bit i set
+        when block i is taken on that term, room and day
+    """
+    room_index = pd.MultiIndex.from_tuples(rooms).get_indexer(
+        pd.MultiIndex.from_arrays(
+            [schedule["building"].astype(int), schedule["room_number"].astype(int)]
+        )
+    )
+    term_index = pd.Index(terms).get_indexer(schedule["term"].astype(int))
+    keep = (room_index >= 0) & (term_index >= 0)
+
+    room_index = room_index[keep]
+    term_index = term_index[keep]
+    starts = schedule["start_min"].to_numpy()[keep]
+    ends = schedule["end_min"].to_numpy()[keep]
+
+    # Same touching-counts-as-taken rule as block_is_vacant
+    block_starts = np.array([to_minutes(start) for start, _ in blocks])
+    block_ends = np.array([to_minutes(end) for _, end in blocks])
+    overlap = (block_starts <= ends[:, None]) & (block_ends >= starts[:, None])
+    row_bits = overlap.astype(np.uint32) @ (
+        np.uint32(1) << np.arange(len(blocks), dtype=np.uint32)
+    )
+
+    bits = np.zeros((len(terms), len(rooms), len(DAY_CODES)), dtype=np.uint32)
+    for d, day in enumerate(DAY_CODES):
+        # Evaluated per distinct day pattern when days is categorical
+        on_day = schedule["days"].str.contains(day, regex=False).to_numpy(bool)[keep]
+        np.bitwise_or.at(
+            bits[:, :, d], (term_index[on_day], room_index[on_day]), row_bits[on_day]
+        )
+    return bits
+
+
+def diff_exports(
+    old_schedule: pd.DataFrame,
+    new_schedule: pd.DataFrame,
+    term: Optional[int] = None,
+    rooms: Iterable[Tuple[int, int]] = MY_ROOMS,
+    grid: Optional[BlockGrid] = None,
+) -> pd.DataFrame:
+    """
+    Time blocks whose availability differs between two exports.
+
+    Both exports are reduced to busy_bits arrays; XOR finds every changed
+    cell at once, and only the changed bits are decoded into rows. Terms
+    on different block grids have different bit layouts, so each grid's
+    terms are compared separately.
+
+    Args:
+        old_schedule: Validated schedule of the previous export
+        new_schedule: Validated schedule of the new export
+        term: Term to compare; compares every term in either export if omitted
+        rooms: (building, room) pairs to compare
+        grid: Block grid for every term; defaults to each term's own grid
+
+    Returns:
+        pd.DataFrame: One row per changed cell, see DIFF_COLUMNS, with
+        ``change`` either "free -> taken" or "taken -> free"
+    """
+    rooms = list(rooms)
+    if term is not None:
+        terms = [term]
+    else:
+        terms = sorted(
+            set(old_schedule["term"].astype(int))
+            | set(new_schedule["term"].astype(int))
+        )
+
+    return combine_changes(
+        decode_changes(
+            busy_bits(old_schedule, grid_terms, rooms, block_grid.blocks),
+            busy_bits(new_schedule, grid_terms, rooms, block_grid.blocks),
+            grid_terms,
+            rooms,
+            block_grid.blocks,
+        )
+        for block_grid, grid_terms in group_terms(terms, grid).items()
+    )
+
+
+def diff_export_files(
+    old_file: str,
+    new_file: str,
+    term: Optional[int] = None,
+    rooms: Iterable[Tuple[int, int]] = MY_ROOMS,
+    grid: Optional[BlockGrid] = None,
+    cache_dir: Path = CACHE_DIR,
+) -> pd.DataFrame:
+    """
+    diff_exports for two export files, reusing cached occupancy.
+
+    Parsing and validating an export costs far more than comparing it, so
+    each export's busy_bits are cached per file revision (see export_bits).
+    Comparing a new export against the previous one only parses the new
+    file, and repeating the comparison parses neither.
+
+    Args:
+        old_file: Path of the previous export
+        new_file: Path of the new export
+        term: Term to compare; compares every term in either export if omitted
+        rooms: (building, room) pairs to compare
+        grid: Block grid for every term; defaults to each term's own grid
+        cache_dir: Directory for the cached occupancy
+
+    Returns:
+        pd.DataFrame: Same rows as diff_exports
+    """
+    rooms = list(rooms)
+    grids = [grid] if grid else list(grid_config().grids.values())
+    old_terms, old_bits = export_bits(old_file, rooms, grids, cache_dir)
+    new_terms, new_bits = export_bits(new_file, rooms, grids, cache_dir)
+    terms = [term] if term is not None else sorted(set(old_terms) | set(new_terms))
+
+    return combine_changes(
+        decode_changes(
+            align_terms(old_bits[block_grid.name], old_terms, grid_terms),
+            align_terms(new_bits[block_grid.name], new_terms, grid_terms),
+            grid_terms,
+            rooms,
+            block_grid.blocks,
+        )
+        for block_grid, grid_terms in group_terms(terms, grid).items()
+    )
+
+
+def export_bits(
+    data_file: str,
+    rooms: List[Tuple[int, int]],
+    grids: List[BlockGrid],
+    cache_dir: Path = CACHE_DIR,
+) -> Tuple[List[int], Dict[str, np.ndarray]]:
+    """
+    busy_bits of every term of an export on each grid, cached on disk.
+
+    Cache files are named by hashes of the export's absolute path, its
+    revision (size and modification time) and the rooms and grids, so
+    exports that share a file name in different folders, or diffs over
+    other rooms or grids, keep separate entries. When an export changes,
+    its cache files for older revisions are removed.
+
+    Args:
+        data_file: Path of the export
+        rooms: (building, room) pairs, in the order of the second axis
+        grids: Grids to build bits for
+        cache_dir: Directory for the cached occupancy
+
+    Returns:
+        The export's terms, in the order of the first axis, and a dict
+        mapping each grid's name to its busy_bits array
+    """
+    path = os.path.abspath(data_file)
+    path_key = cache_key(path)
+    version_key = cache_key(data_file_version(path))
+    cache_dir = Path(cache_dir)
+    cache_file = cache_dir / (
+        f"{path_key}-{version_key}-"
+        f"{cache_key([rooms, [list(g) for g in grids]])}.npz"
+    )
+
+    if cache_file.exists():
+        with np.load(cache_file) as cached:
+            terms = cached["terms"].tolist()
+            return terms, {g.name: cached[f"grid{i}"] for i, g in enumerate(grids)}
+
+    schedule = load_schedule(path)
+    terms = sorted(set(schedule["term"].astype(int)))
+    bits = {g.name: busy_bits(schedule, terms, rooms, g.blocks) for g in grids}
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for cached_file in cache_dir.glob(f"{path_key}-*.npz"):
+        if not cached_file.name.startswith(f"{path_key}-{version_key}-"):
+            cached_file.unlink(missing_ok=True)
+    # Write to a temporary file first so a crash never leaves half a cache
+    tmp_file = cache_file.with_suffix(".tmp.npz")
+    np.savez(
+        tmp_file,
+        terms=np.array(terms, dtype=np.int64),
+        **{f"grid{i}": bits[g.name] for i, g in enumerate(grids)},
+    )
+    os.replace(tmp_file, cache_file)
+    return terms, bits
+
+
+def cache_key(value) -> str:
+    """Short stable hash of a JSON-serialisable value, for cache file names"""
+    return hashlib.sha1(json.dumps(value).encode()).hexdigest()[:16]
+
+
+def align_terms(
+    bits: np.ndarray, bits_terms: List[int], terms: List[int]
+) -> np.ndarray:
+    """Reorder busy_bits onto terms; terms missing from the export are all free"""
+    aligned = np.zeros((len(terms),) + bits.shape[1:], dtype=bits.dtype)
+    positions = pd.Index(bits_terms, dtype="int64").get_indexer(terms)
+    found = positions >= 0
+    aligned[found] = bits[positions[found]]
+    return aligned
+
+
+def group_terms(
+    terms: List[int], grid: Optional[BlockGrid] = None
+) -> Dict[BlockGrid, List[int]]:
+    """Group terms by the grid they are compared on"""
+    terms_by_grid: Dict[BlockGrid, List[int]] = {}
+    for term in terms:
+        terms_by_grid.setdefault(grid or grid_for(term), []).append(term)
+    return terms_by_grid
+
+
+def combine_changes(frames: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate per-grid changes in term order"""
+    frames = list(frames)
+    if not frames:
+        return pd.DataFrame(columns=DIFF_COLUMNS)
+    return pd.concat(frames).sort_values("term", kind="stable", ignore_index=True)
+
+
+def decode_changes(
+    old_bits: np.ndarray,
+    new_bits: np.ndarray,
+    terms: List[int],
+    rooms: List[Tuple[int, int]],
+    blocks: Sequence[Tuple[str, str]] = TIME_BLOCKS,
+) -> pd.DataFrame:
+    """Decode the bits that differ between two busy_bits arrays into rows"""
+    changed = old_bits ^ new_bits
+
+    block_bits = np.arange(len(blocks), dtype=np.uint32)
+    t, r, d, b = np.nonzero((changed[..., None] >> block_bits) & 1)
+    now_taken = (new_bits[t, r, d] >> b.astype(np.uint32)) & 1
+
+    building, room = np.array(rooms, dtype=int).reshape(-1, 2)[r].T
+    return pd.DataFrame(
+        {
+            "term": np.array(terms, dtype=int)[t],
+            "building": building,
+            "room": room,
+            "day": np.array(list(DAY_CODES))[d],
+            "start": np.array([start for start, _ in blocks])[b],
+            "end": np.array([end for _, end in blocks])[b],
+            "change": np.where(now_taken == 1, "free -> taken", "taken -> free"),
+        },
+        columns=DIFF_COLUMNS,
+    )
+
+
+def format_diff_report(diff: pd.DataFrame) -> List[str]:
+    """Render a diff as report lines grouped by building"""
+    if diff.empty:
+        return ["No availability changes between the two exports."]
+
+    lines = []
+    for building, changes in diff.groupby("building", sort=True):
+        lines.append(f"Building {building} ({len(changes)} changes):")
+        for row in changes.itertuples(index=False):
+            lines.append(
+                f"  {row.term} Room {row.room} {row.day} "
+                f"{row.start}-{row.end}: {row.change}"
+            )
+    return lines
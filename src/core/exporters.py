@@ -0,0 +1,237 @@
+import csv
+import json
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+)
+
+from src.core.constants.room_caps import ROOM_CAPS
+from src.core.constants.time_blocks import TIME_BLOCKS
+from src.core.room_finder import block_is_vacant
+from src.core.validation import DAY_CODES, to_minutes
+
+EXPORT_FORMATS = ("csv", "jsonl", "ics")
+
+# iCalendar weekday names for the registrar day codes
+ICS_DAYS = {"M": "MO", "T": "TU", "W": "WE", "R": "TH", "F": "FR", "S": "SA"}
+
+
+class AvailabilityRow(NamedTuple):
+    """One room/day/time block and whether it is free"""
+
+    building: int
+    room: int
+    capacity: Optional[int]
+    day: str
+    start: str
+    end: str
+    free: bool
+
+
+def iter_slot_rows(
+    occupied_slots: Dict[str, Dict[str, List[Tuple[int, int]]]],
+    days: Iterable[str],
+    rooms: Optional[Iterable[Tuple[int, int]]] = None,
+    blocks: Sequence[Tuple[str, str]] = TIME_BLOCKS,
+) -> Iterator[AvailabilityRow]:
+    """
+    Generate availability rows straight from an occupancy index.
+
+    Args:
+        occupied_slots: Occupancy as returned by build_occupied_slots
+        days: Day codes to generate rows for
+        rooms: (building, room) pairs to report; defaults to every room
+            in the index
+        blocks: Time block grid to report, see block_grids
+
+    Yields:
+        AvailabilityRow for every room, day and time block
+    """
+    days = list(days)
+    if rooms is None:
+        rooms = sorted(tuple(map(int, key.split("-"))) for key in occupied_slots)
+    block_minutes = [(to_minutes(start), to_minutes(end)) for start, end in blocks]
+
+    for building, room in rooms:
+        room_days = occupied_slots.get(f"{building}-{room}", {})
+        capacity = ROOM_CAPS.get((building, room))
+        for day in days:
+            occupied = room_days.get(day, [])
+            for (start, end), (block_start, block_end) in zip(blocks, block_minutes):
+                yield AvailabilityRow(
+                    building,
+                    room,
+                    capacity,
+                    day,
+                    start,
+                    end,
+                    block_is_vacant(block_start, block_end, occupied),
+                )
+
+
+def iter_result_rows(
+    results: Dict[str, Dict], blocks: Sequence[Tuple[str, str]] = TIME_BLOCKS
+) -> Iterator[AvailabilityRow]:
+    """
+    Generate availability rows from a find_vacant_rooms result.
+
+    Args:
+        results: Dict as returned by find_vacant_rooms
+        blocks: Time block grid the result was searched on
+
+    Yields:
+        AvailabilityRow for every room, requested day and time block
+    """
+    for room_key, room_data in results.items():
+        building, room = map(int, room_key.split("-"))
+        for day, vacant in room_data["vacant_times"].items():
+            vacant = {tuple(block) for block in vacant}
+            for start, end in blocks:
+                yield AvailabilityRow(
+                    building,
+                    room,
+                    room_data["capacity"],
+                    day,
+                    start,
+                    end,
+                    (start, end) in vacant,
+                )
+
+
+def write_csv(rows: Iterable[AvailabilityRow], out: TextIO) -> int:
+    """Write rows as CSV one at a time, returning the number written"""
+    writer = csv.writer(out)
+    writer.writerow(["building", "room", "capacity", "day", "start", "end", "status"])
+    count = 0
+    for row in rows:
+        writer.writerow(
+            [
+                row.building,
+                row.room,
+                "" if row.capacity is None else row.capacity,
+                row.day,
+                row.start,
+                row.end,
+                "free" if row.free else "busy",
+            ]
+        )
+        count += 1
+    return count
+
+
+def write_jsonl(rows: Iterable[AvailabilityRow], out: TextIO) -> int:
+    """Write rows as JSON Lines one at a time, returning the number written"""
+    count = 0
+    for row in rows:
+        out.write(json.dumps(row._asdict()))
+        out.write("\n")
+        count += 1
+    return count
+
+
+def write_ics(
+    rows: Iterable[AvailabilityRow],
+    out: TextIO,
+    start_date: date,
+    until: Optional[date] = None,
+) -> int:
+    """
+    Write rows as a free/busy iCalendar of weekly recurring events.
+
+    Free blocks are transparent events and busy blocks are opaque, so
+    calendar clients show the room's free/busy pattern for each week.
+
+    Args:
+        rows: Availability rows to write
+        out: Text stream opened with newline="" (iCalendar uses CRLF)
+        start_date: First date the recurring events can fall on
+        until: Optional last date of the recurrence
+
+    Returns:
+        int: Number of events written
+    """
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    rrule_until = f";UNTIL={until.strftime('%Y%m%d')}T235959" if until else ""
+
+    def line(text: str) -> None:
+        out.write(text + "\r\n")
+
+    line("BEGIN:VCALENDAR")
+    line("VERSION:2.0")
+    line("PRODID:-//room_search//Room Finder//EN")
+    count = 0
+    for row in rows:
+        # First date on or after start_date that falls on this weekday
+        first = start_date + timedelta(
+            days=(DAY_CODES.index(row.day) - start_date.weekday()) % 7
+        )
+        status = "Free" if row.free else "Busy"
+        line("BEGIN:VEVENT")
+        line(f"UID:{row.building}-{row.room}-{row.day}-{row.start}@room_search")
+        line(f"DTSTAMP:{stamp}")
+        line(f"DTSTART:{first.strftime('%Y%m%d')}T{row.start.replace(':', '')}00")
+        line(f"DTEND:{first.strftime('%Y%m%d')}T{row.end.replace(':', '')}00")
+        line(f"RRULE:FREQ=WEEKLY;BYDAY={ICS_DAYS[row.day]}{rrule_until}")
+        line(f"SUMMARY:{status}: Building {row.building}, Room {row.room}")
+        line(f"TRANSP:{'TRANSPARENT' if row.free else 'OPAQUE'}")
+        line("END:VEVENT")
+        count += 1
+    line("END:VCALENDAR")
+    return count
+
+
+def export_rows(
+    rows: Iterable[AvailabilityRow],
+    output: Path,
+    fmt: Optional[str] = None,
+    start_date: Optional[date] = None,
+    until: Optional[date] = None,
+) -> int:
+    """
+    Stream availability rows to a file.
+
+    Args:
+        rows: Availability rows, ideally a generator
+        output: File to write
+        fmt: One of EXPORT_FORMATS; inferred from the file suffix if omitted
+        start_date: First date for .ics events, defaults to today
+        until: Optional last date for .ics events
+
+    Returns:
+        int: Number of rows written
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    fmt = fmt or Path(output).suffix.lstrip(".").lower()
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format '{fmt}', use {EXPORT_FORMATS}")
+
+    with open(output, "w", newline="", encoding="utf-8") as out:
+        return write_stream(rows, out, fmt, start_date, until)
+
+
+def write_stream(
+    rows: Iterable[AvailabilityRow],
+    out: TextIO,
+    fmt: str,
+    start_date: Optional[date] = None,
+    until: Optional[date] = None,
+) -> int:
+    """Dispatch rows to the writer for fmt, returning the number written"""
+    if fmt == "csv":
+        return write_csv(rows, out)
+    if fmt == "jsonl":
+        return write_jsonl(rows, out)
+    if fmt == "ics":
+        return write_ics(rows, out, start_date or date.today(), until)
+    raise ValueError(f"Unsupported export format '{fmt}', use {EXPORT_FORMATS}")
@@ -4,29 +4,26 @@ import os
 import sys
 from datetime import date, datetime, time
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 import pandas as pd
 
 # Get project root directory (assuming src is a subdirectory of the project root)
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
-# Create logs directory if it doesn't exist
-os.makedirs(PROJECT_ROOT / "logs", exist_ok=True)
-
-# Set up logging with absolute path
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler(str(PROJECT_ROOT / "logs/room_finder.log")),
-        logging.StreamHandler(),
-    ],
-)
-
+from src.core.block_grids import grid_for
 from src.core.constants.my_rooms import MY_ROOMS
 from src.core.constants.room_caps import ROOM_CAPS
 from src.core.constants.time_blocks import TIME_BLOCKS
+from src.core.schedule_store import compact_schedule
+from src.core.validation import (
+    DAY_CODES,
+    to_minutes,
+    validate_schedule,
+    write_quarantine,
+)
+
+logger = logging.getLogger(__name__)
 
 
 def get_room_cap(building: int, room: int) -> int:
@@ -45,7 +42,9 @@ def parse_time(time_str: str) -> datetime:
             return datetime.strptime(time_str.strip(), "%H:%M")
         return time_str  # Return as is if already a datetime
     except ValueError as e:
-        logging.error(f"Failed to parse time '{time_str}': {e}")
+        logger.error(
+            "Failed to parse time", extra={"fields": {"value": time_str, "error": e}}
+        )
         return None
 
 
@@ -53,7 +52,9 @@ def parse_date(date_str: str) -> Optional[date]:
     try:
         return datetime.strptime(date_str, "%Y-%m-%d").date()
     except ValueError as e:
-        logging.error(f"Failed to parse date '{date_str}': {e}")
+        logger.error(
+            "Failed to parse date", extra={"fields": {"value": date_str, "error": e}}
+        )
         return None
 
 
@@ -78,208 +79,283 @@ def is_conflict(class_time: Tuple[time, time], block_time: Tuple[time, time]) ->
     return (class_start < block_end) and (block_start < class_end)
 
 
-def find_vacant_rooms(
-    term: int, days: List[str], data_file: str = "*data*.csv"
-) -> Dict[str, Dict]:
+DATA_DIR = PROJECT_ROOT / "data"
+QUARANTINE_DIR = PROJECT_ROOT / "logs"
 
-    try:
 
-        # Define column name mappings (original -> standardized)
-        COLUMN_MAPPING = {
-            "Term": "term",
-            "Building": "building",
-            "Room Number": "room_number",
-            "Room Cap": "room_cap",
-            "Start Time": "start_time",
-            "End Time": "end_time",
-            "Days": "days",
-        }
+def find_data_file(data_file: str = "*data*.csv") -> str:
+    """
+    Find the most recent export matching a pattern in the data directory.
 
-        print(f"Received days parameter: {days} (type: {type(days)})")
+    Args:
+        data_file: Glob pattern, relative to the data directory or absolute
 
-        # Find the most recent data file
-        data_path = os.path.join(
-            os.path.dirname(__file__), "..", "..", "data", "*data*.csv"
-        )
-        data_files = glob.glob(data_path)
-        if not data_files:
-            print(f"Searching for data files in: {data_path}")
-            raise FileNotFoundError(f"No data files found matching {data_path}")
-        latest_file = max(data_files, key=os.path.getctime)
-        logging.info(f"Loading data from: {latest_file}")
-
-        # Read CSV with explicit dtypes, but read building as string first
-        df = pd.read_csv(
-            latest_file,
-            dtype={
-                "building": str,  # Read as string first to handle 'TBA'
-                "room_number": float,
-                "room_cap": "Int64",  # Use nullable integer type
-                "days": str,
-                "term": "Int64",
-            },
-        )
+    Returns:
+        str: Path of the newest matching file
 
-        # Filter out rows where building is 'TBA' or non-numeric
-        df = df[df["building"].str.isnumeric().fillna(False)]
-        # Now convert building to int
-        df["building"] = df["building"].astype(int)
+    Raises:
+        FileNotFoundError: If nothing matches the pattern
+    """
+    data_path = os.path.join(DATA_DIR, data_file)
+    data_files = glob.glob(data_path)
+    if not data_files:
+        raise FileNotFoundError(f"No data files found matching {data_path}")
+    return max(data_files, key=os.path.getctime)
 
-        # Filter data for the requested term
-        filtered_df = df[df["term"] == term]
 
-        # Create a set of occupied time slots for each room
-        occupied_slots = {}
-        for _, row in filtered_df.iterrows():
-            try:
-                building = int(row["building"])
-                room = (
-                    int(float(row["room_number"]))
-                    if pd.notna(row["room_number"])
-                    else None
-                )
-                start = str(row["start_time"])
-                end = str(row["end_time"])
-                days_raw = row["days"]
+def data_file_version(path: str) -> Dict[str, object]:
+    """
+    Identify a specific revision of an export without reading it.
 
-                # Skip if we don't have valid building and room
-                if room is None or pd.isna(building):
-                    continue
+    Args:
+        path: Path of the export
 
-                room_key = f"{building}-{room}"
+    Returns:
+        Dict of the file's name, size and modification time, which changes
+        whenever the registrar drops a new export in place
+    """
+    stat = os.stat(path)
+    return {
+        "file": os.path.basename(path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
 
-                # Skip invalid time entries
-                if pd.isna(start) or pd.isna(end):
-                    continue
 
-                if room_key not in occupied_slots:
-                    occupied_slots[room_key] = {d: [] for d in "MTWRFS"}
-
-                # Handle combined day codes (e.g., 'TR' -> ['T', 'R'])
-                if pd.notna(days_raw):
-                    # Convert to string and handle any numeric values
-                    days_str = str(days_raw)
-                    if days_str.isdigit():
-                        print(f"Warning: Numeric day value found: {days_str}")
-                        continue
-
-                    # Convert day codes like 'TR' into individual days
-                    day_chars = [c for c in days_str if c in "MTWRFS"]
-                    for day in day_chars:
-                        if (start, end) not in occupied_slots[room_key][day]:
-                            occupied_slots[room_key][day].append((start, end))
-
-            except Exception as e:
-                print(f"Error processing row: {e}")
-                print(f"Row data: days={days_raw}, building={building}, room={room}")
-                continue
-
-        # Now create the vacant rooms dictionary
-        vacant_rooms = {}
-
-        for building, room in MY_ROOMS:
+def load_schedule(data_file: str = "*data*.csv", compact: bool = True) -> pd.DataFrame:
+    """
+    Load the most recent export and run it through validation.
+
+    Rejected rows are written to the quarantine files in the logs directory,
+    so everything returned here is clean and typed.
+
+    Args:
+        data_file: Glob pattern, relative to the data directory or absolute
+        compact: Return the compact categorical form (see schedule_store)
+
+    Returns:
+        pd.DataFrame: Validated schedule rows
+    """
+    latest_file = find_data_file(data_file)
+    logger.info("Loading data", extra={"fields": {"file": latest_file}})
+
+    # Read everything as text; validation decides what parses
+    df = pd.read_csv(latest_file, dtype=str)
+    df.columns = df.columns.str.strip().str.lower().str.replace(" ", "_")
+
+    clean, rejected, counts = validate_schedule(df)
+    write_quarantine(rejected, counts, latest_file, QUARANTINE_DIR)
+    return compact_schedule(clean) if compact else clean
+
+
+def build_occupied_slots(
+    df: pd.DataFrame, term: int
+) -> Dict[str, Dict[str, List[Tuple[int, int]]]]:
+    """
+    Collect the occupied (start_min, end_min) intervals per room and day.
+
+    Args:
+        df: Validated schedule rows from load_schedule
+        term: Term to collect occupancy for
+
+    Returns:
+        Dict mapping "building-room" to a dict of day code -> intervals
+    """
+    term_df = df[df["term"] == term]
+
+    occupied_slots = {}
+    for building, room, days_str, start, end in zip(
+        term_df["building"],
+        term_df["room_number"],
+        term_df["days"],
+        term_df["start_min"],
+        term_df["end_min"],
+    ):
+        room_key = f"{building}-{room}"
+        if room_key not in occupied_slots:
+            occupied_slots[room_key] = {d: [] for d in DAY_CODES}
+
+        interval = (int(start), int(end))
+        # Day codes like 'TR' occupy each of their days
+        for day in days_str:
+            if interval not in occupied_slots[room_key][day]:
+                occupied_slots[room_key][day].append(interval)
+
+    return occupied_slots
+
+
+def block_is_vacant(
+    block_start: int, block_end: int, occupied: List[Tuple[int, int]]
+) -> bool:
+    """
+    Check a time block against a room's occupied intervals for one day.
+
+    Args:
+        block_start: Block start in minutes since midnight
+        block_end: Block end in minutes since midnight
+        occupied: Occupied (start_min, end_min) intervals
+
+    Returns:
+        bool: True if no interval touches the block
+    """
+    for occ_start, occ_end in occupied:
+        if block_start <= occ_end and block_end >= occ_start:
+            return False
+    return True
+
+
+def vacancy_mask(
+    occupied: Iterable[Tuple[int, int]], block_minutes: List[Tuple[int, int]]
+) -> int:
+    """
+    Encode which time blocks are vacant as a bitmask.
+
+    Args:
+        occupied: Occupied (start_min, end_min) intervals for one room and day
+        block_minutes: Time blocks as (start_min, end_min), bit i is block i
+
+    Returns:
+        int: Bitmask with bit i set when block i is vacant
+    """
+    occupied = list(occupied)
+    mask = 0
+    for i, (block_start, block_end) in enumerate(block_minutes):
+        if block_is_vacant(block_start, block_end, occupied):
+            mask |= 1 << i
+    return mask
+
+
+def vacant_rooms_from_slots(
+    occupied_slots: Dict[str, Dict[str, List[Tuple[int, int]]]],
+    days: List[str],
+    blocks: Sequence[Tuple[str, str]] = TIME_BLOCKS,
+) -> Dict[str, Dict]:
+    """
+    Work out the vacant time blocks of MY_ROOMS from prebuilt occupancy.
+
+    Args:
+        occupied_slots: Occupancy as returned by build_occupied_slots
+        days: Day codes to report on
+        blocks: Time block grid to check, see block_grids
+
+    Returns:
+        Dict mapping "building-room" to its capacity and vacant blocks per day
+    """
+    block_minutes = [(to_minutes(start), to_minutes(end)) for start, end in blocks]
+
+    # Now create the vacant rooms dictionary
+    vacant_rooms = {}
+
+    for building, room in MY_ROOMS:
+        try:
+            room_key = f"{building}-{room}"
+
+            # Get room capacity from constants
             try:
-                room_key = f"{building}-{room}"
-
-                # Get room capacity from constants
-                try:
-                    room_cap = get_room_cap(building, room)
-                except KeyError:
-                    logging.critical(
-                        f"Room {room} in building {building} not found in capacity data"
-                    )
-                    print(f"ERROR: Room {room} in building {building} not found")
-                    sys.exit(1)
-
-                vacant_times = {}
-                # Process each requested day
-                for day in days:
-                    vacant_times[day] = []  # Initialize empty list for this day
-
-                    if room_key not in occupied_slots:
-                        # Room has no occupancy data, all times are vacant
-                        vacant_times[day] = list(TIME_BLOCKS)
-                    else:
-                        # Get occupied times for this day
-                        occupied = occupied_slots[room_key].get(day, [])
-
-                        # Check each time block
-                        for time_block in TIME_BLOCKS:
-                            is_vacant = True
-                            for occ_start, occ_end in occupied:
-                                if overlaps(
-                                    time_block[0], time_block[1], occ_start, occ_end
-                                ):
-                                    is_vacant = False
-                                    break
-                            if is_vacant:
-                                vacant_times[day].append(time_block)
-
-                # Always include the room, even if it has no vacant times
-                vacant_rooms[room_key] = {
-                    "capacity": room_cap,
-                    "vacant_times": vacant_times,
-                }
+                room_cap = get_room_cap(building, room)
+            except KeyError:
+                logger.critical(
+                    "Room not found in capacity data",
+                    extra={"fields": {"building": building, "room": room}},
+                )
+                sys.exit(1)
 
-            except Exception as e:
-                print(f"Error processing room {building}-{room}: {e}")
-                continue
-
-        print(f"\nFound {len(vacant_rooms)} rooms with vacant times")
-        # Debug print a sample of the vacant_rooms structure
-        if vacant_rooms:
-            sample_key = next(iter(vacant_rooms))
-            print(f"Sample vacant room data structure:")
-            print(f"Key: {sample_key}")
-            print(f"Value: {vacant_rooms[sample_key]}")
-
-        # Ensure consistent data structure for all rooms
-        final_rooms = {}
-        for room_key, room_data in vacant_rooms.items():
-            # Ensure each room has both capacity and vacant_times
-            final_room = {
-                "capacity": int(room_data.get("capacity", 0)),
-                "vacant_times": {},
+            vacant_times = {}
+            # Process each requested day
+            for day in days:
+                vacant_times[day] = []  # Initialize empty list for this day
+
+                if room_key not in occupied_slots:
+                    # Room has no occupancy data, all times are vacant
+                    vacant_times[day] = list(blocks)
+                else:
+                    # Get occupied times for this day
+                    occupied = occupied_slots[room_key].get(day, [])
+
+                    # Check each time block
+                    for time_block, (block_start, block_end) in zip(
+                        blocks, block_minutes
+                    ):
+                        if block_is_vacant(block_start, block_end, occupied):
+                            vacant_times[day].append(time_block)
+
+            # Always include the room, even if it has no vacant times
+            vacant_rooms[room_key] = {
+                "capacity": room_cap,
+                "vacant_times": vacant_times,
             }
 
-            # Ensure each day has a list of time tuples
-            for day in days:
-                final_room["vacant_times"][day] = [
-                    (str(start), str(end))
-                    for start, end in room_data["vacant_times"].get(day, [])
-                ]
+        except Exception as e:
+            logger.warning(
+                "Error processing room",
+                extra={"fields": {"room": f"{building}-{room}", "error": e}},
+            )
+            continue
+
+    logger.debug(
+        "Found rooms with vacant times", extra={"fields": {"rooms": len(vacant_rooms)}}
+    )
+
+    # Ensure consistent data structure for all rooms
+    final_rooms = {}
+    for room_key, room_data in vacant_rooms.items():
+        # Ensure each room has both capacity and vacant_times
+        final_room = {
+            "capacity": int(room_data.get("capacity", 0)),
+            "vacant_times": {},
+        }
 
-            final_rooms[str(room_key)] = final_room
+        # Ensure each day has a list of time tuples
+        for day in days:
+            final_room["vacant_times"][day] = [
+                (str(start), str(end))
+                for start, end in room_data["vacant_times"].get(day, [])
+            ]
 
-        if final_rooms:
-            sample_key = next(iter(final_rooms))
-            print(f"\nSample final room: {sample_key}: {final_rooms[sample_key]}")
+        final_rooms[str(room_key)] = final_room
 
-        # Before returning, verify all time blocks are tuples
-        for room_data in final_rooms.values():
-            for day_times in room_data["vacant_times"].values():
-                for i, time_block in enumerate(day_times):
-                    if not isinstance(time_block, tuple):
-                        day_times[i] = tuple(time_block)
+    if final_rooms and logger.isEnabledFor(logging.DEBUG):
+        sample_key = next(iter(final_rooms))
+        logger.debug(
+            "Sample final room",
+            extra={"fields": {"room": sample_key, "value": final_rooms[sample_key]}},
+        )
 
-        # Store the return value first
-        result = final_rooms
+    # Before returning, verify all time blocks are tuples
+    for room_data in final_rooms.values():
+        for day_times in room_data["vacant_times"].values():
+            for i, time_block in enumerate(day_times):
+                if not isinstance(time_block, tuple):
+                    day_times[i] = tuple(time_block)
 
-        # Verify it's still a dictionary
-        assert isinstance(result, dict), "Result is not a dictionary!"
-        assert all(
-            isinstance(v, dict) for v in result.values()
-        ), "Not all values are dictionaries!"
+    # Store the return value first
+    result = final_rooms
 
-        return result
+    # Verify it's still a dictionary
+    assert isinstance(result, dict), "Result is not a dictionary!"
+    assert all(
+        isinstance(v, dict) for v in result.values()
+    ), "Not all values are dictionaries!"
+
+    return result
 
-    except Exception as e:
-        print(f"Error in find_vacant_rooms: {e}")
-        print(f"Error type: {type(e)}")
-        print(f"Error location: {e.__traceback__.tb_frame.f_code.co_name}")
-        import traceback
 
-        traceback.print_exc()
+def find_vacant_rooms(
+    term: int, days: List[str], data_file: str = "*data*.csv"
+) -> Dict[str, Dict]:
+
+    try:
+        logger.debug("Searching", extra={"fields": {"term": term, "days": days}})
+
+        df = load_schedule(data_file)
+
+        # Create a set of occupied time slots for each room
+        occupied_slots = build_occupied_slots(df, term)
+
+        return vacant_rooms_from_slots(occupied_slots, days, grid_for(term).blocks)
+
+    except Exception:
+        logger.exception("Error in find_vacant_rooms")
         raise
 
 
@@ -292,12 +368,29 @@ def overlaps(start1: str, end1: str, start2: str, end2: str) -> bool:
         e2 = parse_time(end2)
 
         if None in (s1, e1, s2, e2):
-            print(f"Warning: Could not parse times: {start1}-{end1} vs {start2}-{end2}")
+            logger.debug(
+                "Could not parse times, assuming overlap",
+                extra={
+                    "fields": {
+                        "first": f"{start1}-{end1}",
+                        "second": f"{start2}-{end2}",
+                    }
+                },
+            )
             return True  # Assume overlap if we can't parse times
 
         return (s1 <= e2) and (e1 >= s2)
     except Exception as e:
-        print(f"Error comparing times: {start1}-{end1} with {start2}-{end2}: {e}")
+        logger.debug(
+            "Error comparing times, assuming overlap",
+            extra={
+                "fields": {
+                    "first": f"{start1}-{end1}",
+                    "second": f"{start2}-{end2}",
+                    "error": e,
+                }
+            },
+        )
         return True  # Assume overlap on error
 
 
@@ -345,7 +438,7 @@ def get_formatted_blocks(blocks, all_blocks):
 
 
 def print_vacancies(
-    vacancies: Dict[Tuple[int, int], Dict[str, List[Tuple[time, time]]]]
+    vacancies: Dict[Tuple[int, int], Dict[str, List[Tuple[time, time]]]],
 ):
     # Get all possible time blocks from constants
     all_blocks = [(parse_time(start), parse_time(end)) for start, end in TIME_BLOCKS]
@@ -0,0 +1,180 @@
+import logging
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.core.constants.time_blocks import TIME_BLOCKS
+from src.core.room_finder import block_is_vacant
+from src.core.validation import minutes_to_time, to_minutes
+
+logger = logging.getLogger(__name__)
+
+# Columns that get an inverted index (value -> row positions) at ingest
+INDEXED_COLUMNS = ("instructor_name", "department", "course_id", "division", "campus")
+
+
+def normalize_key(value: str) -> str:
+    """Index keys are compared trimmed and case-insensitively"""
+    return " ".join(str(value).split()).upper()
+
+
+class ScheduleIndex:
+    """
+    Inverted indexes over a validated schedule.
+
+    Each indexed column maps its values to the row positions of the sections
+    carrying them, and the columns needed to answer queries are kept as
+    plain arrays. A lookup touches only the matching rows, never the whole
+    DataFrame.
+    """
+
+    def __init__(self, schedule: pd.DataFrame):
+        self.terms = schedule["term"].to_numpy()
+        self.buildings = schedule["building"].to_numpy()
+        self.rooms = schedule["room_number"].to_numpy()
+        self.days = schedule["days"].to_numpy()
+        self.start_min = schedule["start_min"].to_numpy()
+        self.end_min = schedule["end_min"].to_numpy()
+        self.course_ids = (
+            schedule["course_id"].to_numpy()
+            if "course_id" in schedule
+            else np.full(len(schedule), "", dtype=object)
+        )
+
+        self.postings: Dict[str, Dict[str, np.ndarray]] = {}
+        for column in INDEXED_COLUMNS:
+            if column not in schedule:
+                continue
+            present = schedule[column].notna().to_numpy()
+            keys = schedule[column][present].map(normalize_key)
+            positions = np.flatnonzero(present)
+            self.postings[column] = {
+                key: positions[members]
+                for key, members in keys.groupby(keys.to_numpy()).indices.items()
+            }
+
+        # Every room known to exist in each building, across all terms
+        self.rooms_by_building: Dict[int, Set[int]] = {}
+        for building, room in set(zip(self.buildings.tolist(), self.rooms.tolist())):
+            self.rooms_by_building.setdefault(building, set()).add(room)
+
+        sizes = {column: len(postings) for column, postings in self.postings.items()}
+        logger.info("Built secondary indexes", extra={"fields": sizes})
+
+    def lookup(self, column: str, value: str, term: Optional[int] = None) -> np.ndarray:
+        """
+        Row positions of the sections whose column equals value.
+
+        Args:
+            column: One of INDEXED_COLUMNS
+            value: Value to look up, matched trimmed and case-insensitively
+            term: Only return sections in this term
+
+        Returns:
+            np.ndarray: Row positions into the indexed schedule
+
+        Raises:
+            KeyError: If the column was not present in the export
+        """
+        if column not in self.postings:
+            raise KeyError(f"Column '{column}' is not indexed")
+        positions = self.postings[column].get(
+            normalize_key(value), np.empty(0, dtype=np.intp)
+        )
+        if term is not None:
+            positions = positions[self.terms[positions] == term]
+        return positions
+
+
+def instructor_schedule_at(
+    index: ScheduleIndex, instructor: str, term: int, days: str, at: str
+) -> List[Dict]:
+    """
+    Where an instructor is teaching at a given time.
+
+    Args:
+        index: Index built from the validated schedule
+        instructor: Instructor name as it appears in the export
+        term: Term to look in
+        days: Day codes such as "TR"; any of them matches
+        at: Time of day as "HH:MM"
+
+    Returns:
+        List of the matching sections' room, course and meeting time
+    """
+    at_min = to_minutes(at)
+    sections = []
+    for i in index.lookup("instructor_name", instructor, term):
+        if not any(day in index.days[i] for day in days):
+            continue
+        if index.start_min[i] <= at_min < index.end_min[i]:
+            sections.append(
+                {
+                    "building": int(index.buildings[i]),
+                    "room": int(index.rooms[i]),
+                    "course_id": index.course_ids[i],
+                    "days": index.days[i],
+                    "start_time": minutes_to_time(int(index.start_min[i])),
+                    "end_time": minutes_to_time(int(index.end_min[i])),
+                }
+            )
+    return sections
+
+
+def teaching_rooms(
+    index: ScheduleIndex, column: str, value: str, term: int
+) -> Set[Tuple[int, int]]:
+    """(building, room) pairs used by sections whose column equals value"""
+    positions = index.lookup(column, value, term)
+    return set(
+        zip(index.buildings[positions].tolist(), index.rooms[positions].tolist())
+    )
+
+
+def free_rooms_near(
+    index: ScheduleIndex,
+    department: str,
+    term: int,
+    days: Iterable[str],
+    occupied_slots: Dict[str, Dict[str, List[Tuple[int, int]]]],
+    blocks: Sequence[Tuple[str, str]] = TIME_BLOCKS,
+) -> Dict[Tuple[str, str], List[Tuple[int, int]]]:
+    """
+    Rooms free on all given days in the buildings a department teaches in.
+
+    Args:
+        index: Index built from the validated schedule
+        department: Department as it appears in the export
+        term: Term to look in
+        days: Day codes the room must be free on
+        occupied_slots: Occupancy for the term from build_occupied_slots
+        blocks: Time block grid to check, see block_grids
+
+    Returns:
+        Dict mapping each time block to the sorted free (building, room) pairs
+    """
+    days = list(days)
+    buildings = {b for b, _ in teaching_rooms(index, "department", department, term)}
+    candidates = sorted(
+        (building, room)
+        for building in buildings
+        for room in index.rooms_by_building.get(building, ())
+    )
+
+    free = {}
+    for start, end in blocks:
+        block_start, block_end = to_minutes(start), to_minutes(end)
+        free[(start, end)] = [
+            (building, room)
+            for building, room in candidates
+            if all(
+                block_is_vacant(
+                    block_start,
+                    block_end,
+                    occupied_slots.get(f"{building}-{room}", {}).get(day, []),
+                )
+                for day in days
+            )
+        ]
+    return free
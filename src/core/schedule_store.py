@@ -0,0 +1,61 @@
+import pandas as pd
+from pandas.api.types import is_integer_dtype
+
+# Text columns become categoricals when at most this share of values is unique
+CATEGORY_RATIO = 0.5
+
+# Minute offsets always fit in int16 (a day has 1440 minutes)
+MINUTE_COLUMNS = ("start_min", "end_min")
+
+
+def compact_column(values: pd.Series) -> pd.Series:
+    """
+    Store one column in the smallest dtype that keeps its values.
+
+    Integer columns (the ones validation typed: term, building, room number)
+    are downcast to the narrowest int type, and repetitive text (day
+    patterns, times, departments, instructors) becomes a categorical.
+    Other text is left as it is, so codes such as "0123" keep their exact
+    spelling whatever else is in the column.
+    """
+    if is_integer_dtype(values):
+        return pd.to_numeric(values, downcast="integer")
+
+    # Work on the distinct values; exports repeat most of them many times
+    codes, uniques = pd.factorize(values)
+    if len(uniques) <= CATEGORY_RATIO * len(values):
+        return pd.Series(pd.Categorical.from_codes(codes, uniques), index=values.index)
+    return values
+
+
+def compact_schedule(schedule: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert a validated schedule into its compact in-memory form.
+
+    Day patterns, times and other repetitive text become categoricals,
+    minute offsets are int16, and building, room and term numbers use the
+    smallest integer type that holds them. Column names and values are
+    unchanged, so every consumer of load_schedule works on either form.
+
+    Args:
+        schedule: Validated schedule rows from validate_schedule
+
+    Returns:
+        pd.DataFrame: Compact copy with a fresh 0..n-1 index
+    """
+    schedule = schedule.reset_index(drop=True)
+    return pd.DataFrame(
+        {
+            column: (
+                schedule[column].astype("int16")
+                if column in MINUTE_COLUMNS
+                else compact_column(schedule[column])
+            )
+            for column in schedule.columns
+        }
+    )
+
+
+def memory_usage_mb(df: pd.DataFrame) -> float:
+    """Deep memory usage of a DataFrame in megabytes"""
+    return df.memory_usage(deep=True).sum() / 2**20
@@ -0,0 +1,235 @@
+import logging
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Day codes used by the registrar export (R = Thursday)
+DAY_CODES = "MTWRFS"
+
+# Columns the search depends on; anything else is carried through untouched
+REQUIRED_COLUMNS = (
+    "term",
+    "building",
+    "room_number",
+    "days",
+    "start_time",
+    "end_time",
+)
+
+TIME_PATTERN = r"^\s*(\d{1,2}):(\d{2})\s*$"
+
+
+def time_to_minutes(times: pd.Series) -> pd.Series:
+    """
+    Convert a column of "HH:MM" strings to minutes since midnight.
+
+    Args:
+        times: Series of time strings
+
+    Returns:
+        Float series of minutes, NaN wherever the value is missing or malformed
+    """
+    parts = times.astype("string").str.extract(TIME_PATTERN)
+    hours = pd.to_numeric(parts[0]).astype("float64")
+    minutes = pd.to_numeric(parts[1]).astype("float64")
+    in_range = (hours < 24) & (minutes < 60)
+    return (hours * 60 + minutes).where(in_range)
+
+
+def by_distinct(
+    values: pd.Series, parse: Callable[[pd.Series], pd.Series]
+) -> pd.Series:
+    """
+    Apply a vectorized parser to each distinct value of a column once.
+
+    Exports repeat a handful of terms, buildings, day patterns and times
+    across every row, so parsing the distinct values and broadcasting the
+    results back is far cheaper than parsing row by row.
+
+    Args:
+        values: Column to parse
+        parse: Vectorized parser taking and returning a Series
+
+    Returns:
+        pd.Series: parse() results aligned with values
+    """
+    codes, uniques = pd.factorize(values)
+    # A trailing None stands in for missing values, which factorize codes as -1
+    parsed = parse(pd.Series(list(uniques) + [None], dtype=object))
+    return pd.Series(parsed.to_numpy()[codes], index=values.index)
+
+
+def parse_digits(values: pd.Series) -> pd.Series:
+    """Integers written as plain digits, NaN for anything else (e.g. 'TBA')"""
+    text = values.astype("string").str.strip()
+    digits = text.str.fullmatch(r"\d+").fillna(False).astype(bool)
+    return pd.to_numeric(text.where(digits), errors="coerce").astype("float64")
+
+
+def normalize_days(values: pd.Series) -> pd.Series:
+    """Day patterns trimmed and uppercased"""
+    return values.astype("string").str.strip().str.upper()
+
+
+def to_minutes(time_str: str) -> int:
+    """Convert a single "HH:MM" string to minutes since midnight"""
+    hours, minutes = time_str.strip().split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def minutes_to_time(minutes: int) -> str:
+    """Format minutes since midnight as an "HH:MM" string"""
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def validate_schedule(
+    df: pd.DataFrame,
+) -> Tuple[pd.DataFrame, pd.DataFrame, Dict[str, int]]:
+    """
+    Split a raw export into clean, typed rows and rejected rows.
+
+    Every check is a vectorized boolean mask over the whole frame, so the
+    cost does not depend on how dirty the file is. A row is rejected if any
+    mask flags it, and every failing reason is recorded.
+
+    Args:
+        df: Raw export with standardized (lowercase) column names
+
+    Returns:
+        Tuple of (clean, rejected, counts) where ``clean`` has integer
+        ``term``/``building``/``room_number``, uppercase ``days``, normalized
+        "HH:MM" times plus ``start_min``/``end_min`` columns; ``rejected``
+        holds the original rows with a ``reasons`` column; and ``counts``
+        maps each reason to the number of rows it flagged.
+
+    Raises:
+        ValueError: If a required column is missing from the export
+    """
+    missing = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+    if missing:
+        raise ValueError(f"Data file is missing required columns: {missing}")
+
+    def numeric_pattern(values: pd.Series) -> pd.Series:
+        return normalize_days(values).str.fullmatch(r"\d+").fillna(False).astype(bool)
+
+    def day_pattern(values: pd.Series) -> pd.Series:
+        pattern = f"[{DAY_CODES}]+"
+        return normalize_days(values).str.fullmatch(pattern).fillna(False).astype(bool)
+
+    # Codes are plain digits; "1e2" or "100.0" would otherwise pass as 100
+    term = by_distinct(df["term"], parse_digits)
+    building = by_distinct(df["building"], parse_digits)
+    room = by_distinct(df["room_number"], parse_digits)
+    days = by_distinct(df["days"], normalize_days)
+    start = by_distinct(df["start_time"], time_to_minutes)
+    end = by_distinct(df["end_time"], time_to_minutes)
+
+    numeric_days = by_distinct(df["days"], numeric_pattern).astype(bool)
+    valid_days = by_distinct(df["days"], day_pattern).astype(bool)
+
+    checks = pd.DataFrame(
+        {
+            "term is missing or not an integer": term.isna(),
+            "building is missing or not numeric": building.isna(),
+            "room number is missing or not an integer": room.isna(),
+            "days is numeric": numeric_days,
+            "days is missing or has invalid day codes": ~valid_days & ~numeric_days,
+            "start time is missing or malformed": start.isna(),
+            "end time is missing or malformed": end.isna(),
+            "start time is not before end time": start.notna()
+            & end.notna()
+            & (start >= end),
+        },
+        index=df.index,
+    )
+
+    bad = checks.any(axis=1)
+    counts = {reason: int(n) for reason, n in checks.sum().items() if n}
+
+    rejected = df[bad].copy()
+    # Boolean matrix times reason labels concatenates every failing reason
+    rejected["reasons"] = (
+        checks[bad].dot(checks.columns + "; ").str.rstrip("; ")
+        if bad.any()
+        else pd.Series(dtype="string")
+    )
+
+    good = ~bad
+    clean = df[good].copy()
+    clean["term"] = term[good].astype(int)
+    clean["building"] = building[good].astype(int)
+    clean["room_number"] = room[good].astype(int)
+    clean["days"] = days[good].astype(str)
+    clean["start_min"] = start[good].astype("int16")
+    clean["end_min"] = end[good].astype("int16")
+    labels = {
+        minutes: minutes_to_time(int(minutes))
+        for minutes in set(clean["start_min"]) | set(clean["end_min"])
+    }
+    clean["start_time"] = clean["start_min"].map(labels)
+    clean["end_time"] = clean["end_min"].map(labels)
+
+    if counts:
+        summary = ", ".join(f"{reason} ({n})" for reason, n in counts.items())
+        logger.warning(
+            "Rejected rows",
+            extra={
+                "fields": {
+                    "rejected": len(rejected),
+                    "rows": len(df),
+                    "reasons": summary,
+                }
+            },
+        )
+
+    return clean, rejected, counts
+
+
+def write_quarantine(
+    rejected: pd.DataFrame,
+    counts: Dict[str, int],
+    source_file: str,
+    output_dir: Path,
+) -> Optional[Path]:
+    """
+    Write rejected rows and a per-reason summary next to each other.
+
+    Produces ``<source>_quarantine.csv`` with the original row data plus a
+    ``reasons`` column, and ``<source>_quarantine_summary.csv`` with one
+    ``reason,count`` line per failing check. Both files are removed when
+    nothing was rejected.
+
+    Args:
+        rejected: Rejected rows as returned by validate_schedule
+        counts: Reason counts as returned by validate_schedule
+        source_file: Path of the export the rows came from
+        output_dir: Directory the quarantine files are written to
+
+    Returns:
+        Path of the quarantine file, or None if there was nothing to write
+    """
+    stem = Path(source_file).stem
+    quarantine_file = output_dir / f"{stem}_quarantine.csv"
+    summary_file = output_dir / f"{stem}_quarantine_summary.csv"
+
+    if rejected.empty:
+        # A corrected export under the same name must not show old rejects
+        quarantine_file.unlink(missing_ok=True)
+        summary_file.unlink(missing_ok=True)
+        return None
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    rejected.to_csv(quarantine_file, index=False)
+    pd.DataFrame(list(counts.items()), columns=["reason", "count"]).to_csv(
+        summary_file, index=False
+    )
+
+    logger.info(
+        "Quarantined rows",
+        extra={"fields": {"rows": len(rejected), "file": quarantine_file}},
+    )
+    return quarantine_file
@@ -0,0 +1,290 @@
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+import pandas as pd
+
+from src.core.constants.my_rooms import MY_ROOMS
+from src.core.constants.time_blocks import TIME_BLOCKS
+from src.core.room_finder import get_room_cap, vacancy_mask
+from src.core.validation import DAY_CODES, to_minutes
+
+Cell = Tuple[str, str]  # (room_key, day)
+
+
+class Meeting(NamedTuple):
+    """One meeting pattern of a section"""
+
+    building: int
+    room: int
+    days: str
+    start_min: int
+    end_min: int
+
+
+class Effect(NamedTuple):
+    """A time block whose vacancy flipped because of a staged change"""
+
+    room_key: str
+    day: str
+    block: Tuple[str, str]
+    free: bool
+
+
+class WhatIfSession:
+    """
+    Stage hypothetical adds, moves and cancellations on top of a term.
+
+    Occupancy is kept as a count of each interval per (room, day) cell and
+    the vacancy of every tracked room/day as a bitmask over the blocks.
+    A change only touches the cells its old and new meetings fall in, so
+    staging or undoing it costs a few dictionary updates rather than a
+    rerun of the search.
+    """
+
+    def __init__(
+        self,
+        schedule: pd.DataFrame,
+        term: int,
+        rooms: Iterable[Tuple[int, int]] = MY_ROOMS,
+        blocks: Sequence[Tuple[str, str]] = TIME_BLOCKS,
+    ):
+        self.term = term
+        self.rooms = list(rooms)
+        self.blocks = list(blocks)
+        self.block_minutes = [
+            (to_minutes(start), to_minutes(end)) for start, end in self.blocks
+        ]
+
+        term_df = schedule[schedule["term"] == term]
+        # Rows without a reference number each get a key of their own
+        row_keys = [f"row {i}" for i in range(len(term_df))]
+        if "reference_number" in term_df:
+            references = [
+                row_key if pd.isna(reference) else section_key(reference)
+                for reference, row_key in zip(term_df["reference_number"], row_keys)
+            ]
+        else:
+            references = row_keys
+
+        self.sections: Dict[str, List[Meeting]] = {}
+        self.intervals: Dict[Cell, Counter] = {}
+        for reference, building, room, days, start, end in zip(
+            references,
+            term_df["building"],
+            term_df["room_number"],
+            term_df["days"],
+            term_df["start_min"],
+            term_df["end_min"],
+        ):
+            meeting = Meeting(int(building), int(room), str(days), int(start), int(end))
+            self.sections.setdefault(reference, []).append(meeting)
+            self._occupy(meeting, 1)
+
+        self.masks: Dict[Cell, int] = {
+            (f"{building}-{room}", day): vacancy_mask(
+                self.intervals.get((f"{building}-{room}", day), ()),
+                self.block_minutes,
+            )
+            for building, room in self.rooms
+            for day in DAY_CODES
+        }
+        self.history: List[Tuple[str, List[Meeting]]] = []
+
+    def _occupy(self, meeting: Meeting, delta: int) -> Set[Cell]:
+        """Add (delta=1) or remove (delta=-1) a meeting, returning its cells"""
+        room_key = f"{meeting.building}-{meeting.room}"
+        interval = (meeting.start_min, meeting.end_min)
+        cells = set()
+        for day in meeting.days:
+            cell = (room_key, day)
+            counts = self.intervals.setdefault(cell, Counter())
+            counts[interval] += delta
+            if counts[interval] <= 0:
+                del counts[interval]
+            cells.add(cell)
+        return cells
+
+    def _replace(
+        self, reference: str, meetings: List[Meeting]
+    ) -> Tuple[List[Meeting], List[Effect]]:
+        """Swap a section's meetings and refresh only the cells involved"""
+        before = self.sections.get(reference, [])
+        touched = set()
+        for meeting in before:
+            touched |= self._occupy(meeting, -1)
+        for meeting in meetings:
+            touched |= self._occupy(meeting, 1)
+
+        if meetings:
+            self.sections[reference] = meetings
+        else:
+            self.sections.pop(reference, None)
+
+        effects = []
+        for cell in touched:
+            if cell not in self.masks:
+                continue  # not a room we report on
+            old_mask = self.masks[cell]
+            new_mask = vacancy_mask(self.intervals[cell], self.block_minutes)
+            self.masks[cell] = new_mask
+            flipped = old_mask ^ new_mask
+            for i, block in enumerate(self.blocks):
+                if flipped >> i & 1:
+                    effects.append(Effect(*cell, block, bool(new_mask >> i & 1)))
+        return before, sorted(effects)
+
+    def _stage(self, reference: str, meetings: List[Meeting]) -> List[Effect]:
+        before, effects = self._replace(reference, meetings)
+        self.history.append((reference, before))
+        return effects
+
+    def add_section(
+        self,
+        reference: object,
+        building: int,
+        room: int,
+        days: str,
+        start: str,
+        end: str,
+    ) -> List[Effect]:
+        """
+        Stage a new section.
+
+        Args:
+            reference: Reference number for the new section
+            building: Building number
+            room: Room number
+            days: Day codes such as "MW"
+            start: Start time as "HH:MM"
+            end: End time as "HH:MM"
+
+        Returns:
+            List of the time blocks this blocks
+
+        Raises:
+            ValueError: If the reference exists or the meeting is invalid
+        """
+        reference = section_key(reference)
+        if reference in self.sections:
+            raise ValueError(f"Section {reference} already exists")
+        meeting = make_meeting(building, room, days, start, end)
+        return self._stage(reference, [meeting])
+
+    def move_section(
+        self,
+        reference: object,
+        building: Optional[int] = None,
+        room: Optional[int] = None,
+        days: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> List[Effect]:
+        """
+        Stage a move of every meeting of a section.
+
+        Only the given fields change; the rest are kept from each meeting.
+
+        Returns:
+            List of the time blocks this frees or blocks
+
+        Raises:
+            KeyError: If the section does not exist
+            ValueError: If a moved meeting is invalid
+        """
+        reference = section_key(reference)
+        if reference not in self.sections:
+            raise KeyError(f"Section {reference} not found in term {self.term}")
+        meetings = [
+            make_meeting(
+                building if building is not None else meeting.building,
+                room if room is not None else meeting.room,
+                days if days is not None else meeting.days,
+                start if start is not None else meeting.start_min,
+                end if end is not None else meeting.end_min,
+            )
+            for meeting in self.sections[reference]
+        ]
+        return self._stage(reference, meetings)
+
+    def cancel_section(self, reference: object) -> List[Effect]:
+        """
+        Stage the cancellation of a section.
+
+        Returns:
+            List of the time blocks this frees
+
+        Raises:
+            KeyError: If the section does not exist
+        """
+        reference = section_key(reference)
+        if reference not in self.sections:
+            raise KeyError(f"Section {reference} not found in term {self.term}")
+        return self._stage(reference, [])
+
+    def undo(self) -> List[Effect]:
+        """Revert the most recently staged change, returning what flips back"""
+        if not self.history:
+            return []
+        reference, before = self.history.pop()
+        _, effects = self._replace(reference, before)
+        return effects
+
+    def vacant_rooms(self, days: List[str]) -> Dict[str, Dict]:
+        """
+        Current availability in the same shape as find_vacant_rooms.
+
+        Args:
+            days: Day codes to report on
+
+        Returns:
+            Dict mapping "building-room" to its capacity and vacant blocks
+        """
+        results = {}
+        for building, room in self.rooms:
+            room_key = f"{building}-{room}"
+            results[room_key] = {
+                "capacity": get_room_cap(building, room),
+                "vacant_times": {
+                    day: [
+                        block
+                        for i, block in enumerate(self.blocks)
+                        if self.masks[(room_key, day)] >> i & 1
+                    ]
+                    for day in days
+                },
+            }
+        return results
+
+
+def section_key(reference: object) -> str:
+    """
+    Key a section by its reference number as text.
+
+    The reference column is text or integers depending on the export, and
+    the what-if window always passes text, so both sides use str keys.
+    """
+    return str(reference).strip()
+
+
+def make_meeting(building: int, room: int, days: str, start, end) -> Meeting:
+    """
+    Build a validated Meeting from user input.
+
+    Args:
+        building: Building number
+        room: Room number
+        days: Day codes such as "MW"
+        start: Start as "HH:MM" or minutes since midnight
+        end: End as "HH:MM" or minutes since midnight
+
+    Raises:
+        ValueError: If the day codes or times are invalid
+    """
+    days = days.upper()
+    if not days or any(day not in DAY_CODES for day in days):
+        raise ValueError(f"Days must be made of {DAY_CODES}, got '{days}'")
+    start_min = to_minutes(start) if isinstance(start, str) else int(start)
+    end_min = to_minutes(end) if isinstance(end, str) else int(end)
+    if not 0 <= start_min < end_min < 24 * 60:
+        raise ValueError("Start time must be before end time within one day")
+    return Meeting(int(building), int(room), days, start_min, end_min)
@@ -1,46 +1,44 @@
-import glob
+import queue
+import threading
 import tkinter as tk
 from collections import defaultdict
-from pathlib import Path
-from tkinter import messagebox, ttk
-
-import pandas as pd
-
-from src.core.constants.time_blocks import TIME_BLOCKS
-from src.core.room_finder import PROJECT_ROOT, find_vacant_rooms, parse_time
-
-PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
-
-
-def load_data():
-    """Load and standardize the DataFrame"""
-    data_pattern = str(PROJECT_ROOT / "data" / "*data*.csv")
-    matching_files = glob.glob(data_pattern)
-    if not matching_files:
-        raise FileNotFoundError(f"No data files found matching pattern: {data_pattern}")
-
-    df = pd.read_csv(matching_files[0])  # Use the first matching file
-    # print("Original columns:", df.columns.tolist())  # Debug
-    df.columns = (
-        df.columns.str.lower()
-    )  # Standardize all column names to lowercase for safety
-    # print("Lowercase columns:", df.columns.tolist())  # Debug
-    return df
-
-
-def get_valid_terms():
-    """Get a list of valid terms from the data file"""
-    try:
-        df = load_data()
-        if "term" in df.columns:
-            terms = sorted(df["term"].unique().tolist())
-            return [str(term) for term in terms]  # Convert to strings for the dropdown
-        else:
-            print("Warning: 'term' column not found in data file")
-            return ["2231"]  # Default fallback
-    except Exception as e:
-        print(f"Error loading terms: {e}")
-        return ["2231"]  # Default fallback
+from tkinter import filedialog, messagebox, ttk
+
+from src.core.answer_table import AnswerTable
+from src.core.block_grids import get_grid, grid_config, grid_for
+from src.core.constants.my_rooms import MY_ROOMS
+from src.core.exporters import export_rows, iter_result_rows
+from src.core.room_finder import (
+    build_occupied_slots,
+    data_file_version,
+    find_data_file,
+    get_room_cap,
+    load_schedule,
+    parse_time,
+    vacant_rooms_from_slots,
+)
+from src.core.what_if import WhatIfSession
+from src.gui.what_if_panel import WhatIfPanel
+from src.utils.settings import (
+    load_settings,
+    load_snapshot,
+    save_settings,
+    save_snapshot,
+)
+
+MY_ROOM_KEYS = {f"{building}-{room}" for building, room in MY_ROOMS}
+
+
+def get_valid_terms(schedule):
+    """Get a list of valid terms from the validated schedule"""
+    terms = sorted(schedule["term"].unique().tolist())
+    return [str(term) for term in terms]  # Convert to strings for the dropdown
+
+
+def load_data_file():
+    """Find, version and load the current export (runs off the UI thread)"""
+    data_file = find_data_file()
+    return data_file_version(data_file), load_schedule(data_file)
 
 
 class RoomFinderGUI:
@@ -64,17 +62,36 @@ class RoomFinderGUI:
             row=0, column=0, sticky=tk.W, pady=5
         )
 
+        # Restore the last session; the export itself is loaded in the background
+        self.settings = load_settings()
+        self.snapshot = load_snapshot()
+        self.schedule = None
+        self.data_version = None
+
+        # Occupancy of MY_ROOMS for the term in index_term, and an answer
+        # table per block grid searched over it; answer_table is self.grid's
+        self.occupied_slots = {}
+        self.index_term = None
+        self.answer_tables = {}
+        self.answer_table = None
+        self.grid = None
+
+        # Hypothetical changes staged in the what-if window, if it is open
+        self.what_if = None
+        self.what_if_panel = None
+        self.what_if_grid = None
+
         # Get available terms
-        self.available_terms = get_valid_terms()
+        self.available_terms = self.snapshot["terms"] if self.snapshot else []
 
         # Create StringVar for the term dropdown
         self.term_var = tk.StringVar()
-        if self.available_terms:
+        if self.settings["term"] in self.available_terms:
+            self.term_var.set(self.settings["term"])
+        elif self.available_terms:
             self.term_var.set(
                 self.available_terms[0]
             )  # Set default to first available term
-        else:
-            self.term_var.set("2231")  # Fallback default
 
         # Create the dropdown
         self.term_dropdown = ttk.Combobox(
@@ -85,13 +102,33 @@ class RoomFinderGUI:
             state="readonly",  # Make it read-only so users can only select from the list
         )
         self.term_dropdown.grid(row=0, column=1, sticky=tk.W, pady=5)
+        self.term_dropdown.bind("<<ComboboxSelected>>", self.on_term_selected)
+
+        # Time block grid, picked from the term but open to override
+        ttk.Label(self.input_frame, text="Grid:").grid(
+            row=0, column=2, sticky=tk.W, padx=(20, 0), pady=5
+        )
+        self.grid_var = tk.StringVar()
+        if self.snapshot and self.snapshot.get("grid") in grid_config().grids:
+            self.grid_var.set(self.snapshot["grid"])
+        else:
+            self.select_term_grid()
+        self.grid_dropdown = ttk.Combobox(
+            self.input_frame,
+            textvariable=self.grid_var,
+            values=list(grid_config().grids),
+            width=10,
+            state="readonly",
+        )
+        self.grid_dropdown.grid(row=0, column=3, sticky=tk.W, pady=5)
+        self.grid_dropdown.bind("<<ComboboxSelected>>", self.on_grid_selected)
 
         # Days selection
         ttk.Label(self.input_frame, text="Days:").grid(
             row=1, column=0, sticky=tk.W, pady=5
         )
         self.days_frame = ttk.Frame(self.input_frame)
-        self.days_frame.grid(row=1, column=1, sticky=tk.W, pady=5)
+        self.days_frame.grid(row=1, column=1, columnspan=3, sticky=tk.W, pady=5)
 
         self.day_vars = {}
         self.day_names = {
@@ -111,15 +148,25 @@ class RoomFinderGUI:
             ("Saturday", "S"),
         ]
         for i, (day_name, day_code) in enumerate(days):
-            self.day_vars[day_code] = tk.BooleanVar(value=False)
+            self.day_vars[day_code] = tk.BooleanVar(
+                value=self.settings["days"].get(day_code, False)
+            )
             ttk.Checkbutton(
                 self.days_frame, text=day_name, variable=self.day_vars[day_code]
             ).grid(row=0, column=i, padx=5)
 
-        # Search button
-        ttk.Button(self.input_frame, text="Search", command=self.search_rooms).grid(
-            row=2, column=0, columnspan=2, pady=10
+        # Search, export and what-if buttons
+        self.buttons_frame = ttk.Frame(self.input_frame)
+        self.buttons_frame.grid(row=2, column=0, columnspan=4, pady=10)
+        ttk.Button(self.buttons_frame, text="Search", command=self.search_rooms).grid(
+            row=0, column=0, padx=5
         )
+        ttk.Button(
+            self.buttons_frame, text="Export...", command=self.export_results
+        ).grid(row=0, column=1, padx=5)
+        ttk.Button(
+            self.buttons_frame, text="What-if...", command=self.open_what_if
+        ).grid(row=0, column=2, padx=5)
 
         # Create a frame for the results
         self.results_frame = ttk.LabelFrame(
@@ -156,8 +203,9 @@ class RoomFinderGUI:
         # Bind the treeview selection event
         self.time_treeview.bind("<<TreeviewSelect>>", self.on_time_block_select)
 
-        # Store the search results
+        # Store the search results and the grid they were computed on
         self.results = {}
+        self.results_grid = None
 
         # Dictionary to store time blocks and rooms
         self.common_time_blocks = {}
@@ -179,10 +227,129 @@ class RoomFinderGUI:
         )
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
 
-        # Set initial status
-        self.status_var.set(
-            f"Ready. Found {len(self.available_terms)} terms in data file."
-        )
+        if self.snapshot:
+            self.restore_snapshot()
+        else:
+            self.status_var.set("Loading data file...")
+
+        # Revalidate against the export without blocking the window
+        self.load_queue = queue.Queue()
+        threading.Thread(target=self.load_in_background, daemon=True).start()
+        self.root.after(100, self.poll_background_load)
+
+    def restore_snapshot(self):
+        """Show the last search from the snapshot without touching the CSV"""
+        snapshot = self.snapshot
+        self.data_version = snapshot["data_version"]
+        self.set_index(int(snapshot["term"]), snapshot["occupied_slots"])
+        self.results = snapshot["results"]
+        self.results_grid = self.grid
+
+        self.term_var.set(snapshot["term"])
+        for day, var in self.day_vars.items():
+            var.set(day in snapshot["days"])
+
+        self.show_results(snapshot["days"])
+        self.status_var.set("Restored last search. Checking data file for changes...")
+
+    def load_in_background(self):
+        """Load the export on a worker thread and hand it to the UI thread"""
+        try:
+            self.load_queue.put((*load_data_file(), None))
+        except Exception as e:
+            self.load_queue.put((None, None, e))
+
+    def poll_background_load(self):
+        """Pick up the background load once it finishes (runs on the UI thread)"""
+        try:
+            data_version, schedule, error = self.load_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(100, self.poll_background_load)
+            return
+
+        if error is not None:
+            self.status_var.set(f"Could not load data file: {error}")
+            return
+
+        changed = data_version != self.data_version
+        self.set_schedule(data_version, schedule)
+
+        if self.snapshot and changed:
+            # The restored results came from an older export
+            self.search_rooms()
+            self.status_var.set(
+                "Data file changed since last session. Results refreshed."
+            )
+        elif self.snapshot:
+            self.status_var.set("Restored last search. Data file is unchanged.")
+        else:
+            self.status_var.set(
+                f"Ready. Found {len(self.available_terms)} terms in data file."
+            )
+
+    def set_schedule(self, data_version, schedule):
+        """Adopt a freshly loaded export and drop anything built from the old one"""
+        if data_version != self.data_version:
+            self.index_term = None
+            self.answer_tables = {}
+            self.answer_table = None
+        self.data_version = data_version
+        self.schedule = schedule
+
+        self.available_terms = get_valid_terms(schedule)
+        self.term_dropdown["values"] = self.available_terms
+        if self.term_var.get() not in self.available_terms and self.available_terms:
+            self.term_var.set(self.available_terms[0])
+            self.select_term_grid()
+
+    def select_term_grid(self):
+        """Point the grid dropdown at the grid the selected term is on"""
+        if self.term_var.get():
+            term = int(self.term_var.get())
+            self.grid_var.set(grid_for(term, self.settings.get("session")).name)
+
+    def on_term_selected(self, event):
+        if self.what_if is not None:
+            # The staged changes belong to the term they were opened for
+            messagebox.showinfo("Term", "Close the what-if window to switch terms")
+            self.term_var.set(str(self.what_if.term))
+            return
+        self.select_term_grid()
+
+    def on_grid_selected(self, event):
+        """Redo the current search on the newly selected grid"""
+        if self.what_if is not None:
+            # The staged changes are tracked on the grid they were opened with
+            messagebox.showinfo("Grid", "Close the what-if window to switch grids")
+            self.grid_var.set(self.what_if_grid.name)
+            return
+        if self.results:
+            self.search_rooms()
+
+    def set_index(self, term, occupied_slots):
+        """Adopt the occupancy of a term and build its day-combination table"""
+        self.index_term = term
+        self.occupied_slots = occupied_slots
+        self.answer_tables = {}
+        self.use_grid(self.grid_var.get())
+
+    def use_grid(self, name):
+        """
+        Switch the answer table to another block grid.
+
+        Each grid has its own bit layout, so each gets its own table, but
+        all of them are built from the term's occupancy in occupied_slots,
+        which is not recomputed. Tables are kept until the term changes.
+        """
+        self.grid = get_grid(name)
+        if name not in self.answer_tables:
+            self.answer_tables[name] = AnswerTable(
+                self.occupied_slots,
+                MY_ROOMS,
+                precompute=self.settings.get("precompute_answers", False),
+                blocks=self.grid.blocks,
+            )
+        self.answer_table = self.answer_tables[name]
 
     def search_rooms(self):
         """Search for vacant rooms based on user input"""
@@ -196,31 +363,44 @@ class RoomFinderGUI:
                 messagebox.showwarning("Warning", "Please select at least one day")
                 return
 
+            if self.what_if is not None and self.what_if.term == term:
+                self.show_what_if_results()
+                return
+
             # Update status
             self.status_var.set("Searching for vacant rooms...")
             self.root.update_idletasks()
 
-            # Call the find_vacant_rooms function
-            self.results = find_vacant_rooms(term, selected_days)
-
-            # Clear the treeview
-            for item in self.time_treeview.get_children():
-                self.time_treeview.delete(item)
-
-            # Find time blocks that are common across all selected days
-            self.find_common_time_blocks(selected_days)
-
-            # Clear the detail text
-            self.detail_text.delete(1.0, tk.END)
-            self.detail_text.insert(
-                tk.END, "Select a time block to see available rooms."
-            )
-
-            # Update status
-            total_rooms = sum(len(rooms) for rooms in self.common_time_blocks.values())
-            self.status_var.set(
-                f"Found {len(self.common_time_blocks)} time blocks available on all selected days"
+            if self.schedule is not None:
+                # Pick up a new export dropped in since it was loaded
+                data_file = find_data_file()
+                data_version = data_file_version(data_file)
+                if data_version != self.data_version:
+                    self.set_schedule(data_version, load_schedule(data_file))
+
+            # Build the occupancy index once per term; day changes reuse it
+            if self.index_term != term:
+                if self.schedule is None:
+                    self.status_var.set("Still loading the data file, please wait...")
+                    return
+                occupied_slots = build_occupied_slots(self.schedule, term)
+                self.set_index(
+                    term,
+                    {
+                        room_key: slots
+                        for room_key, slots in occupied_slots.items()
+                        if room_key in MY_ROOM_KEYS
+                    },
+                )
+            elif self.grid is None or self.grid.name != self.grid_var.get():
+                self.use_grid(self.grid_var.get())
+
+            self.results = vacant_rooms_from_slots(
+                self.occupied_slots, selected_days, self.grid.blocks
             )
+            self.results_grid = self.grid
+            self.show_results(selected_days)
+            self.save_session(term, selected_days)
 
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred: {str(e)}")
@@ -229,8 +409,137 @@ class RoomFinderGUI:
 
             traceback.print_exc()
 
-    def find_common_time_blocks(self, selected_days):
-        """Find time blocks that are common across all selected days"""
+    def open_what_if(self):
+        """Open the what-if window for the selected term"""
+        if self.what_if_panel is not None:
+            self.what_if_panel.window.lift()
+            return
+        if self.schedule is None:
+            messagebox.showinfo("What-if", "Still loading the data file, please wait")
+            return
+
+        self.what_if_grid = get_grid(self.grid_var.get())
+        self.what_if = WhatIfSession(
+            self.schedule, int(self.term_var.get()), blocks=self.what_if_grid.blocks
+        )
+        self.what_if_panel = WhatIfPanel(
+            self.root, self.what_if, self.show_what_if_results, self.close_what_if
+        )
+        self.show_what_if_results()
+
+    def show_what_if_results(self):
+        """Show availability with the staged what-if changes applied"""
+        selected_days = [day for day, var in self.day_vars.items() if var.get()]
+        if not selected_days:
+            return
+
+        self.term_var.set(str(self.what_if.term))
+        self.results = self.what_if.vacant_rooms(selected_days)
+        self.results_grid = self.what_if_grid
+        self.show_results(selected_days)
+        self.status_var.set(
+            f"What-if: {len(self.what_if.history)} staged changes. "
+            "Results are hypothetical."
+        )
+
+    def close_what_if(self):
+        """Drop the staged changes and go back to the real schedule"""
+        self.what_if = None
+        self.what_if_panel = None
+        # Never leave hypothetical results on screen or up for export
+        self.clear_results()
+        if any(var.get() for var in self.day_vars.values()):
+            self.search_rooms()
+        else:
+            self.status_var.set("What-if closed. Select days and search again.")
+
+    def clear_results(self):
+        """Forget the current results and empty the treeview and details"""
+        self.results = {}
+        self.results_grid = None
+        self.common_time_blocks = {}
+        for item in self.time_treeview.get_children():
+            self.time_treeview.delete(item)
+        self.detail_text.delete(1.0, tk.END)
+
+    def export_results(self):
+        """Stream the current results to a CSV, JSON Lines or iCalendar file"""
+        if not self.results:
+            messagebox.showwarning("Warning", "Run a search before exporting")
+            return
+
+        output = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[
+                ("CSV", "*.csv"),
+                ("JSON Lines", "*.jsonl"),
+                ("iCalendar", "*.ics"),
+            ],
+        )
+        if not output:
+            return
+
+        try:
+            rows = iter_result_rows(self.results, self.results_grid.blocks)
+            count = export_rows(rows, output)
+            self.status_var.set(f"Exported {count} time blocks to {output}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Export failed: {str(e)}")
+
+    def show_results(self, selected_days):
+        """Fill the treeview from self.results"""
+        # Clear the treeview
+        for item in self.time_treeview.get_children():
+            self.time_treeview.delete(item)
+
+        # Find time blocks that are common across all selected days
+        self.find_common_time_blocks(selected_days)
+
+        # Clear the detail text
+        self.detail_text.delete(1.0, tk.END)
+        self.detail_text.insert(tk.END, "Select a time block to see available rooms.")
+
+        # Update status
+        self.status_var.set(
+            f"Found {len(self.common_time_blocks)} time blocks available on all selected days"
+        )
+
+    def save_session(self, term, selected_days):
+        """Persist the query and a snapshot of its index and results"""
+        save_settings(
+            str(term),
+            self.settings.get("session", "1"),
+            {day: var.get() for day, var in self.day_vars.items()},
+            self.settings.get("precompute_answers", False),
+        )
+        save_snapshot(
+            self.data_version,
+            self.available_terms,
+            str(term),
+            selected_days,
+            self.occupied_slots,
+            self.results,
+            self.grid.name,
+        )
+
+    def lookup_common_rooms(self, selected_days):
+        """Rooms free on all selected days, straight from the answer table"""
+        return {
+            f"{start}-{end}": [
+                {
+                    "building": str(building),
+                    "room": str(room),
+                    "capacity": get_room_cap(building, room),
+                }
+                for building, room in rooms
+            ]
+            for (start, end), rooms in self.answer_table.free_rooms(
+                selected_days
+            ).items()
+        }
+
+    def intersect_results(self, selected_days):
+        """Rooms free on all selected days, intersected from self.results"""
         # Dictionary to track rooms available at each time block for each day
         time_blocks_by_day = defaultdict(lambda: defaultdict(list))
 
@@ -251,7 +560,7 @@ class RoomFinderGUI:
                     time_blocks_by_day[day][time_block].append(room_info)
 
         # Find time blocks that exist in all selected days
-        self.common_time_blocks = {}
+        common_by_block = {}
 
         # Get all unique time blocks across all days
         all_time_blocks = set()
@@ -289,20 +598,33 @@ class RoomFinderGUI:
                     # Add the common rooms to our list
                     common_rooms = list(potential_rooms.values())
 
-                if common_rooms:
-                    # Format the days string (e.g., "Tuesday, Thursday")
-                    days_str = ", ".join(self.day_names[day] for day in selected_days)
+                common_by_block[time_block] = common_rooms
+
+        return common_by_block
 
-                    # Add to treeview
-                    self.time_treeview.insert(
-                        "",
-                        tk.END,
-                        values=(time_block, days_str, len(common_rooms)),
-                        iid=time_block,
-                    )
+    def find_common_time_blocks(self, selected_days):
+        """Find time blocks that are common across all selected days"""
+        if self.answer_table is not None and self.what_if is None:
+            common_by_block = self.lookup_common_rooms(selected_days)
+        else:
+            common_by_block = self.intersect_results(selected_days)
 
-                    # Store the common rooms for this time block
-                    self.common_time_blocks[time_block] = common_rooms
+        self.common_time_blocks = {}
+        for time_block, common_rooms in common_by_block.items():
+            if common_rooms:
+                # Format the days string (e.g., "Tuesday, Thursday")
+                days_str = ", ".join(self.day_names[day] for day in selected_days)
+
+                # Add to treeview
+                self.time_treeview.insert(
+                    "",
+                    tk.END,
+                    values=(time_block, days_str, len(common_rooms)),
+                    iid=time_block,
+                )
+
+                # Store the common rooms for this time block
+                self.common_time_blocks[time_block] = common_rooms
 
         # Sort the treeview items by start time
         items = [
@@ -0,0 +1,125 @@
+import tkinter as tk
+from tkinter import messagebox, ttk
+
+from src.core.what_if import WhatIfSession
+
+
+class WhatIfPanel:
+    """Window for staging hypothetical section changes against a term"""
+
+    FIELDS = [
+        ("reference", "Ref #"),
+        ("building", "Building"),
+        ("room", "Room"),
+        ("days", "Days"),
+        ("start", "Start (HH:MM)"),
+        ("end", "End (HH:MM)"),
+    ]
+
+    def __init__(self, parent, session: WhatIfSession, on_change, on_close):
+        self.session = session
+        self.on_change = on_change
+        self.on_close = on_close
+
+        self.window = tk.Toplevel(parent)
+        self.window.title(f"What-if: term {session.term}")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        form = ttk.LabelFrame(self.window, text="Section", padding="10")
+        form.pack(fill=tk.X, padx=10, pady=10)
+
+        self.vars = {}
+        for row, (name, label) in enumerate(self.FIELDS):
+            ttk.Label(form, text=f"{label}:").grid(row=row, column=0, sticky=tk.W)
+            self.vars[name] = tk.StringVar()
+            ttk.Entry(form, textvariable=self.vars[name], width=12).grid(
+                row=row, column=1, sticky=tk.W, pady=2
+            )
+
+        buttons = ttk.Frame(self.window)
+        buttons.pack(fill=tk.X, padx=10)
+        for column, (text, command) in enumerate(
+            [
+                ("Add", self.add),
+                ("Move", self.move),
+                ("Cancel section", self.cancel),
+                ("Undo", self.undo),
+            ]
+        ):
+            ttk.Button(buttons, text=text, command=command).grid(
+                row=0, column=column, padx=5
+            )
+
+        effects_frame = ttk.LabelFrame(self.window, text="Effects", padding="10")
+        effects_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.effects_text = tk.Text(effects_frame, wrap=tk.WORD, height=12, width=50)
+        self.effects_text.pack(fill=tk.BOTH, expand=True)
+
+    def value(self, name):
+        """Field value, or None if left blank"""
+        text = self.vars[name].get().strip()
+        return text or None
+
+    def reference(self):
+        text = self.value("reference")
+        if text is None:
+            raise ValueError("Enter a reference number")
+        return text
+
+    def add(self):
+        self.apply(
+            "Added",
+            lambda: self.session.add_section(
+                self.reference(),
+                int(self.value("building")),
+                int(self.value("room")),
+                self.value("days"),
+                self.value("start"),
+                self.value("end"),
+            ),
+        )
+
+    def move(self):
+        building, room = self.value("building"), self.value("room")
+        self.apply(
+            "Moved",
+            lambda: self.session.move_section(
+                self.reference(),
+                building=int(building) if building else None,
+                room=int(room) if room else None,
+                days=self.value("days"),
+                start=self.value("start"),
+                end=self.value("end"),
+            ),
+        )
+
+    def cancel(self):
+        self.apply("Cancelled", lambda: self.session.cancel_section(self.reference()))
+
+    def undo(self):
+        self.apply("Undid last change", self.session.undo, needs_reference=False)
+
+    def apply(self, action, stage, needs_reference=True):
+        """Stage a change, list what it frees or blocks and refresh results"""
+        try:
+            effects = stage()
+        except (KeyError, ValueError, TypeError) as e:
+            messagebox.showerror("What-if", str(e), parent=self.window)
+            return
+
+        label = f"{action} {self.value('reference')}" if needs_reference else action
+        self.effects_text.insert(tk.END, f"{label}:\n")
+        if not effects:
+            self.effects_text.insert(tk.END, "  no change for tracked rooms\n")
+        for effect in effects:
+            start, end = effect.block
+            verb = "frees" if effect.free else "blocks"
+            self.effects_text.insert(
+                tk.END, f"  {verb} {effect.room_key} {effect.day} {start}-{end}\n"
+            )
+        self.effects_text.see(tk.END)
+        self.on_change()
+
+    def close(self):
+        self.window.destroy()
+        self.on_close()
@@ -6,14 +6,18 @@ def parse_time(time_str: str) -> Optional[time]:
     try:
         return datetime.strptime(time_str, "%H:%M").time()
     except ValueError as e:
-        logging.error(f"Failed to parse time '{time_str}': {e}")
+        logging.error(
+            "Failed to parse time", extra={"fields": {"value": time_str, "error": e}}
+        )
         return None
 
 def parse_date(date_str: str) -> Optional[date]:
     try:
         return datetime.strptime(date_str, "%Y-%m-%d").date()
     except ValueError as e:
-        logging.error(f"Failed to parse date '{date_str}': {e}")
+        logging.error(
+            "Failed to parse date", extra={"fields": {"value": date_str, "error": e}}
+        )
         return None
 
 def do_dates_overlap(start1: date, end1: date, start2: date, end2: date) -> bool:
@@ -0,0 +1,142 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+LOG_DIR = Path(__file__).resolve().parent.parent.parent / "logs"
+LOG_FILE = LOG_DIR / "room_finder.log"
+
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s%(fields_text)s"
+
+# Console level per -v count; the log file always gets INFO or more
+VERBOSITY_LEVELS = [logging.WARNING, logging.INFO, logging.DEBUG]
+
+_listener: Optional[QueueListener] = None
+
+
+class StructuredFormatter(logging.Formatter):
+    """
+    Append a record's structured fields as key=value pairs.
+
+    Fields are passed with ``extra={"fields": {...}}`` so a message stays
+    constant (and easy to grep or rate-limit) while its details vary.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = getattr(record, "fields", None) or {}
+        record.fields_text = "".join(f" {key}={value}" for key, value in fields.items())
+        return super().format(record)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Let through at most ``burst`` copies of a warning or error per interval.
+
+    Records are told apart by logger, level and message text, so messages
+    must keep their details in fields: "Failed to parse time" repeated for
+    every bad row of an export is logged a few times, then counted. The
+    next copy after the interval carries the number suppressed in a
+    ``suppressed`` field. Critical records and anything below WARNING
+    always pass.
+    """
+
+    def __init__(self, burst: int = 5, interval: float = 60.0):
+        super().__init__()
+        self.burst = burst
+        self.interval = interval
+        self.lock = threading.Lock()
+        # (logger, level, msg) -> [window start, passed, suppressed]
+        self.windows: Dict[Tuple[str, int, str], list] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not logging.WARNING <= record.levelno < logging.CRITICAL:
+            return True
+
+        key = (record.name, record.levelno, str(record.msg))
+        now = time.monotonic()
+        with self.lock:
+            window = self.windows.get(key)
+            if window is None or now - window[0] >= self.interval:
+                suppressed = window[2] if window else 0
+                self.windows[key] = [now, 1, 0]
+                if suppressed:
+                    record.fields = {
+                        **(getattr(record, "fields", None) or {}),
+                        "suppressed": suppressed,
+                    }
+                return True
+            if window[1] < self.burst:
+                window[1] += 1
+                return True
+            window[2] += 1
+            return False
+
+
+def configure_logging(
+    verbosity: int = 0, log_file: Optional[Path] = LOG_FILE
+) -> QueueListener:
+    """
+    Route all logging through a queue drained by a background thread.
+
+    Callers only pay for putting a record on the queue; the file and
+    console writes happen on the listener thread. Entry points call this
+    once at startup; library modules only create loggers.
+
+    Args:
+        verbosity: 0 shows warnings on the console, 1 adds info, 2 adds debug
+        log_file: File that receives INFO and up (DEBUG at verbosity 2),
+            or None for console only
+
+    Returns:
+        QueueListener: The running listener, stopped automatically at exit
+    """
+    global _listener
+    if _listener is not None:
+        stop_logging()
+
+    console_level = VERBOSITY_LEVELS[min(max(verbosity, 0), len(VERBOSITY_LEVELS) - 1)]
+    formatter = StructuredFormatter(LOG_FORMAT)
+
+    handlers = []
+    console = logging.StreamHandler()
+    console.setLevel(console_level)
+    console.setFormatter(formatter)
+    handlers.append(console)
+
+    if log_file is not None:
+        Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler.setLevel(min(console_level, logging.INFO))
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.addFilter(RateLimitFilter())
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(min(handler.level for handler in handlers))
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(stop_logging)
@@ -1,10 +1,19 @@
 import json
+import os
 from pathlib import Path
+from typing import Optional
 
-# Keep the settings file in the gui folder
-SETTINGS_FILE = Path("src/gui/gui_settings.json")
+# Keep the settings file in the gui folder, independent of the working directory
+GUI_DIR = Path(__file__).resolve().parent.parent / "gui"
+SETTINGS_FILE = GUI_DIR / "gui_settings.json"
 
-def save_settings(term: str, session: str, days: dict[str, bool]) -> None:
+# Last query, its occupancy index and results, tied to the export they came from
+SNAPSHOT_FILE = GUI_DIR / "gui_snapshot.json"
+SNAPSHOT_FORMAT = 1
+
+def save_settings(
+    term: str, session: str, days: dict[str, bool], precompute_answers: bool = False
+) -> None:
     """Save the current GUI settings to a JSON file"""
     # Create gui directory if it doesn't exist
     SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
@@ -12,7 +21,9 @@ def save_settings(term: str, session: str, days: dict[str, bool]) -> None:
     settings = {
         "term": term,
         "session": session,
-        "days": days
+        "days": days,
+        # Fill all day combinations per term up front instead of on first use
+        "precompute_answers": precompute_answers
     }
     
     with open(SETTINGS_FILE, 'w') as f:
@@ -27,5 +38,61 @@ def load_settings() -> dict:
         return {
             "term": "",  # Will default to first term in list
             "session": "1",
-            "days": {day: True for day in "MTWRFS"}
-        } 
\ No newline at end of file
+            "days": {day: True for day in "MTWRFS"},
+            "precompute_answers": False
+        }
+
+
+def save_snapshot(
+    data_version: dict,
+    terms: list[str],
+    term: str,
+    days: list[str],
+    occupied_slots: dict,
+    results: dict,
+    grid: Optional[str] = None,
+) -> None:
+    """Save the last search so the GUI can show it again on launch"""
+    snapshot = {
+        "format": SNAPSHOT_FORMAT,
+        "data_version": data_version,
+        "terms": terms,
+        "term": term,
+        "days": days,
+        "occupied_slots": occupied_slots,
+        "results": results,
+        # Block grid the results were searched on
+        "grid": grid,
+    }
+
+    # Write to a temporary file first so a crash never leaves half a snapshot
+    SNAPSHOT_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = SNAPSHOT_FILE.with_suffix(".tmp")
+    with open(tmp_file, 'w') as f:
+        json.dump(snapshot, f, separators=(",", ":"))
+    os.replace(tmp_file, SNAPSHOT_FILE)
+
+def load_snapshot() -> Optional[dict]:
+    """Load the last search snapshot, or None if there is no usable one"""
+    try:
+        with open(SNAPSHOT_FILE, 'r') as f:
+            snapshot = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    if snapshot.get("format") != SNAPSHOT_FORMAT:
+        return None
+
+    # JSON has no tuples; restore the (start, end) pairs the GUI expects
+    snapshot["occupied_slots"] = {
+        room_key: {
+            day: [tuple(slot) for slot in slots] for day, slots in room_days.items()
+        }
+        for room_key, room_days in snapshot["occupied_slots"].items()
+    }
+    for room_data in snapshot["results"].values():
+        room_data["vacant_times"] = {
+            day: [tuple(block) for block in blocks]
+            for day, blocks in room_data["vacant_times"].items()
+        }
+    return snapshot
@@ -0,0 +1,55 @@
+import random
+from typing import Dict, List, Sequence, Tuple
+
+import pandas as pd
+
+from src.core.schedule_store import compact_schedule
+from src.core.validation import minutes_to_time, validate_schedule
+
+
+def load(records) -> pd.DataFrame:
+    """Validated, compacted schedule from raw export records"""
+    clean, _, _ = validate_schedule(pd.DataFrame(records, dtype=object))
+    return compact_schedule(clean)
+
+
+def random_records(
+    seed: int,
+    rows: int,
+    rooms: Sequence[Tuple[int, int]],
+    days: Sequence[str],
+    terms: Sequence[str] = ("20252",),
+    step: int = 15,
+    latest: int = 20 * 60,
+    first_reference: int = 0,
+) -> List[Dict[str, str]]:
+    """
+    Export records of random 75-minute sections, as text like the CSV.
+
+    Args:
+        seed: Seed for the random choices
+        rows: Number of sections
+        rooms: (building, room) pairs to place sections in
+        days: Day patterns to pick from
+        terms: Term codes to pick from
+        step: Start times fall on multiples of this many minutes
+        latest: Sections start before this minute of the day
+        first_reference: Reference number of the first section
+    """
+    rng = random.Random(seed)
+    records = []
+    for reference in range(first_reference, first_reference + rows):
+        building, room = rng.choice(rooms)
+        start = rng.randrange(8 * 60, latest, step)
+        records.append(
+            {
+                "term": rng.choice(terms),
+                "building": str(building),
+                "room_number": str(room),
+                "days": rng.choice(days),
+                "start_time": minutes_to_time(start),
+                "end_time": minutes_to_time(start + 75),
+                "reference_number": str(reference),
+            }
+        )
+    return records
@@ -0,0 +1,55 @@
+from src.core.answer_table import (
+    ALL_COMBINATIONS,
+    AnswerTable,
+    combination_days,
+    combination_key,
+)
+from src.core.constants.my_rooms import MY_ROOMS
+from src.core.constants.time_blocks import TIME_BLOCKS
+from src.core.room_finder import build_occupied_slots, vacant_rooms_from_slots
+from src.core.validation import DAY_CODES
+from tests.conftest import load, random_records
+
+
+def occupied_slots(seed: int):
+    records = random_records(
+        seed, 150, MY_ROOMS, ["MW", "TR", "MWF", "F", "S", "MTWRF"]
+    )
+    return build_occupied_slots(load(records), 20252)
+
+
+def searched_free_rooms(slots, days: str):
+    """Free rooms per block from a plain vacancy search, as AnswerTable reports"""
+    vacant = vacant_rooms_from_slots(slots, list(days))
+    return {
+        block: [
+            (building, room)
+            for building, room in MY_ROOMS
+            if all(
+                block in vacant[f"{building}-{room}"]["vacant_times"][day]
+                for day in days
+            )
+        ]
+        for block in TIME_BLOCKS
+    }
+
+
+def test_every_combination_matches_a_vacancy_search():
+    slots = occupied_slots(1)
+    lazy = AnswerTable(slots)
+    full = AnswerTable(slots, precompute=True)
+    assert len(full.answers) == len(ALL_COMBINATIONS)
+
+    # Reverse order makes the lazy table fill large combinations recursively
+    for key in reversed(ALL_COMBINATIONS):
+        days = combination_days(key)
+        expected = searched_free_rooms(slots, days)
+        assert lazy.free_rooms(days) == expected, days
+        assert full.free_rooms(days) == expected, days
+    assert lazy.answers == full.answers
+
+
+def test_combination_keys_round_trip():
+    for key in ALL_COMBINATIONS:
+        assert combination_key(combination_days(key)) == key
+    assert combination_days(combination_key(DAY_CODES)) == DAY_CODES
@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+from src.core.block_grids import (
+    GRIDS_FILE,
+    MAX_BLOCKS,
+    STANDARD_GRID,
+    GridConfig,
+    load_grid_config,
+    make_grid,
+)
+
+EXAMPLE_FILE = GRIDS_FILE.with_name("block_grids.example.json")
+
+
+def grid(name):
+    return make_grid(name, [("08:00", "09:00")])
+
+
+def test_grid_must_fit_in_a_mask():
+    blocks = [
+        (f"{h // 60:02d}:{h % 60:02d}", f"{h // 60:02d}:{h % 60 + 5:02d}")
+        for h in range(0, 24 * 60, 10)
+    ][: MAX_BLOCKS + 1]
+
+    assert len(make_grid("fine", blocks[:MAX_BLOCKS]).blocks) == MAX_BLOCKS
+    with pytest.raises(ValueError, match="at most 32"):
+        make_grid("too_many", blocks)
+
+
+def test_term_rule_beats_session_beats_suffix_beats_default():
+    config = GridConfig(
+        {name: grid(name) for name in ["base", "term", "session", "suffix"]},
+        default="base",
+        terms={"20253": "term"},
+        sessions={"EVE": "session"},
+        term_suffixes={"3": "suffix"},
+    )
+
+    assert config.grid_for(20253, "EVE").name == "term"
+    assert config.grid_for(20243, "EVE").name == "session"
+    assert config.grid_for(20243).name == "suffix"
+    assert config.grid_for(20243, "DAY").name == "suffix"
+    assert config.grid_for(20252, "DAY").name == "base"
+
+
+def test_rules_naming_unknown_grids_are_rejected(tmp_path):
+    grids_file = tmp_path / "block_grids.json"
+    for rules in [
+        {"terms": {"20253": "summer"}},
+        {"sessions": {"EVE": "evening"}},
+        {"term_suffixes": {"3": "summer"}},
+        {"default": "summer"},
+    ]:
+        grids_file.write_text(json.dumps(rules))
+        with pytest.raises(ValueError, match="Unknown time block grid"):
+            load_grid_config(grids_file)
+
+
+def test_shipped_file_only_has_the_standard_grid(tmp_path):
+    assert list(load_grid_config().grids) == [STANDARD_GRID]
+    assert list(load_grid_config(tmp_path / "missing.json").grids) == [STANDARD_GRID]
+
+    example = load_grid_config(EXAMPLE_FILE)
+    assert example.grid_for(20253).name == "summer"
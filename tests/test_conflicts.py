@@ -0,0 +1,92 @@
+import random
+from itertools import combinations
+
+import pandas as pd
+
+from src.core.conflicts import find_conflicts
+from src.core.validation import validate_schedule
+from tests.conftest import load, random_records
+
+SESSIONS = [("2025-01-10", "2025-05-01"), ("2025-01-10", "2025-03-01")]
+LATE_SESSION = ("2025-03-02", "2025-05-01")
+
+
+def random_schedule(seed: int, rows: int = 400) -> pd.DataFrame:
+    """Two buildings' rooms with some sections running only part of the term"""
+    records = random_records(
+        seed,
+        rows,
+        rooms=[(b, r) for b in (3, 5) for r in (103, 104, 105)],
+        days=["MW", "TR", "M", "F", "MWF"],
+        terms=["20251", "20252"],
+    )
+    rng = random.Random(seed)
+    for record in records:
+        first_day, last_day = rng.choice(SESSIONS + [LATE_SESSION])
+        record.update(
+            course_id=f"C{record['reference_number']}",
+            start_date=first_day,
+            end_date=last_day,
+        )
+    return load(records)
+
+
+def pairwise_conflicts(schedule: pd.DataFrame, use_dates: bool) -> set:
+    """Compare every pair of sections directly"""
+    found = set()
+    rows = list(schedule.itertuples(index=False))
+    for a, b in combinations(rows, 2):
+        if (a.term, a.building, a.room_number) != (b.term, b.building, b.room_number):
+            continue
+        if a.reference_number == b.reference_number:
+            continue
+        if not (a.start_min < b.end_min and b.start_min < a.end_min):
+            continue
+        if use_dates and not (
+            a.start_date <= b.end_date and b.start_date <= a.end_date
+        ):
+            continue
+        for day in set(a.days) & set(b.days):
+            pair = frozenset([a.reference_number, b.reference_number])
+            found.add((a.term, a.building, a.room_number, day, pair))
+    return found
+
+
+def sweep_conflicts(schedule: pd.DataFrame, use_dates: bool) -> set:
+    conflicts = find_conflicts(schedule, use_dates=use_dates)
+    return {
+        (
+            row.term,
+            row.building,
+            row.room,
+            row.day,
+            frozenset([row.reference_a, row.reference_b]),
+        )
+        for row in conflicts.itertuples(index=False)
+    }
+
+
+def test_sweep_matches_pairwise_comparison():
+    for seed in range(3):
+        schedule = random_schedule(seed)
+        for use_dates in (True, False):
+            expected = pairwise_conflicts(schedule, use_dates)
+            assert expected, "the sample should contain conflicts"
+            assert sweep_conflicts(schedule, use_dates) == expected
+
+
+def test_back_to_back_and_duplicate_listings_are_not_conflicts():
+    records = pd.DataFrame(
+        {
+            "term": ["20252"] * 3,
+            "building": ["5"] * 3,
+            "room_number": ["103"] * 3,
+            "days": ["MW"] * 3,
+            "start_time": ["08:00", "09:15", "09:15"],
+            "end_time": ["09:15", "10:30", "10:30"],
+            "reference_number": ["1", "2", "2"],
+        },
+        dtype=object,
+    )
+    schedule, _, _ = validate_schedule(records)
+    assert find_conflicts(schedule).empty
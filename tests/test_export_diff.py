@@ -0,0 +1,104 @@
+import pandas as pd
+
+from src.core import export_diff
+from src.core.block_grids import grid_for
+from src.core.constants.my_rooms import MY_ROOMS
+from src.core.export_diff import diff_export_files, diff_exports
+from src.core.room_finder import build_occupied_slots, vacant_rooms_from_slots
+from src.core.validation import DAY_CODES
+from tests.conftest import load, random_records
+
+
+def random_export(seed: int, rows: int = 300) -> pd.DataFrame:
+    """Sections across MY_ROOMS and three terms, including Saturdays"""
+    records = random_records(
+        seed,
+        rows,
+        MY_ROOMS,
+        ["MW", "TR", "MWF", "S"],
+        terms=["20251", "20252", "20253"],
+        latest=21 * 60,
+    )
+    return pd.DataFrame(records, dtype=object)
+
+
+def recomputed_changes(old: pd.DataFrame, new: pd.DataFrame) -> set:
+    """Changed cells from a full vacancy search of both exports"""
+    changes = set()
+    for term in sorted(set(old["term"]) | set(new["term"])):
+        blocks = grid_for(term).blocks
+        before = vacant_rooms_from_slots(
+            build_occupied_slots(old, term), list(DAY_CODES), blocks
+        )
+        after = vacant_rooms_from_slots(
+            build_occupied_slots(new, term), list(DAY_CODES), blocks
+        )
+        for room_key in before:
+            building, room = map(int, room_key.split("-"))
+            for day in DAY_CODES:
+                was_free = set(before[room_key]["vacant_times"][day])
+                now_free = set(after[room_key]["vacant_times"][day])
+                for start, end in was_free - now_free:
+                    changes.add(
+                        (term, building, room, day, start, end, "free -> taken")
+                    )
+                for start, end in now_free - was_free:
+                    changes.add(
+                        (term, building, room, day, start, end, "taken -> free")
+                    )
+    return changes
+
+
+def as_set(diff: pd.DataFrame) -> set:
+    return set(diff.itertuples(index=False, name=None))
+
+
+def test_diff_matches_recomputed_occupancy():
+    old = load(random_export(1))
+    new = load(random_export(2))
+
+    expected = recomputed_changes(old, new)
+    assert expected
+    assert as_set(diff_exports(old, new)) == expected
+    assert diff_exports(old, old).empty
+
+
+def test_export_files_are_parsed_once(tmp_path, monkeypatch):
+    old_file, new_file = tmp_path / "old.csv", tmp_path / "new.csv"
+    random_export(1).to_csv(old_file, index=False)
+    random_export(2).to_csv(new_file, index=False)
+    cache_dir = tmp_path / "cache"
+
+    first = diff_export_files(old_file, new_file, cache_dir=cache_dir)
+    assert as_set(first) == recomputed_changes(
+        load(random_export(1)), load(random_export(2))
+    )
+
+    def no_parsing(*args, **kwargs):
+        raise AssertionError("export parsed despite the cache")
+
+    monkeypatch.setattr(export_diff, "load_schedule", no_parsing)
+    second = diff_export_files(old_file, new_file, cache_dir=cache_dir)
+    assert second.equals(first)
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+def test_exports_with_the_same_name_keep_their_own_cache(tmp_path, monkeypatch):
+    old_file = tmp_path / "old" / "export_data.csv"
+    new_file = tmp_path / "new" / "export_data.csv"
+    for folder, seed in ((old_file, 1), (new_file, 2)):
+        folder.parent.mkdir()
+        random_export(seed).to_csv(folder, index=False)
+    cache_dir = tmp_path / "cache"
+
+    first = diff_export_files(old_file, new_file, cache_dir=cache_dir)
+    assert not first.empty
+    diff_export_files(old_file, new_file, rooms=MY_ROOMS[:5], cache_dir=cache_dir)
+
+    def no_parsing(*args, **kwargs):
+        raise AssertionError("export parsed despite the cache")
+
+    monkeypatch.setattr(export_diff, "load_schedule", no_parsing)
+    for _ in range(2):
+        assert diff_export_files(old_file, new_file, cache_dir=cache_dir).equals(first)
+    assert len(list(cache_dir.glob("*.npz"))) == 4
@@ -0,0 +1,73 @@
+import csv
+import json
+from datetime import date, datetime
+
+from src.core.constants.my_rooms import MY_ROOMS
+from src.core.exporters import (
+    AvailabilityRow,
+    export_rows,
+    iter_result_rows,
+    iter_slot_rows,
+)
+from src.core.room_finder import build_occupied_slots, vacant_rooms_from_slots
+from src.core.validation import DAY_CODES
+from tests.conftest import load, random_records
+
+DAYS = list(DAY_CODES)
+
+
+def occupied_slots():
+    records = random_records(1, 120, MY_ROOMS, ["MW", "TR", "F", "S"])
+    return build_occupied_slots(load(records), 20252)
+
+
+def test_slot_rows_match_result_rows():
+    slots = occupied_slots()
+    from_slots = list(iter_slot_rows(slots, DAYS, rooms=MY_ROOMS))
+    from_results = list(iter_result_rows(vacant_rooms_from_slots(slots, DAYS)))
+
+    assert from_slots == from_results
+    assert {row.free for row in from_slots} == {True, False}
+
+
+def test_csv_and_jsonl_round_trip(tmp_path):
+    rows = list(iter_slot_rows(occupied_slots(), DAYS, rooms=MY_ROOMS))
+
+    assert export_rows(rows, tmp_path / "rooms.csv") == len(rows)
+    with open(tmp_path / "rooms.csv", newline="") as f:
+        from_csv = [
+            AvailabilityRow(
+                int(r["building"]),
+                int(r["room"]),
+                int(r["capacity"]) if r["capacity"] else None,
+                r["day"],
+                r["start"],
+                r["end"],
+                r["status"] == "free",
+            )
+            for r in csv.DictReader(f)
+        ]
+    assert from_csv == rows
+
+    assert export_rows(rows, tmp_path / "rooms.jsonl") == len(rows)
+    with open(tmp_path / "rooms.jsonl") as f:
+        from_jsonl = [AvailabilityRow(**json.loads(line)) for line in f]
+    assert from_jsonl == rows
+
+
+def test_ics_uses_crlf_and_each_day_code_lands_on_its_weekday(tmp_path):
+    wednesday = date(2025, 1, 15)
+    rows = [AvailabilityRow(5, 103, 30, day, "08:00", "09:15", True) for day in DAYS]
+
+    output = tmp_path / "rooms.ics"
+    assert export_rows(rows, output, start_date=wednesday) == len(DAYS)
+    content = output.read_bytes()
+    assert content.endswith(b"END:VCALENDAR\r\n")
+    assert content.count(b"\n") == content.count(b"\r\n")
+
+    lines = content.decode().split("\r\n")
+    starts = [line.split(":", 1)[1] for line in lines if line.startswith("DTSTART")]
+    for day, start in zip(DAYS, starts):
+        first = datetime.strptime(start, "%Y%m%dT%H%M%S").date()
+        assert first.weekday() == DAY_CODES.index(day), day
+        assert 0 <= (first - wednesday).days < 7, day
@@ -0,0 +1,31 @@
+import logging
+
+from src.utils import logging_setup
+from src.utils.logging_setup import RateLimitFilter
+
+
+def record(msg: str, level: int = logging.ERROR) -> logging.LogRecord:
+    return logging.LogRecord("src.test", level, __file__, 1, msg, None, None)
+
+
+def test_repeats_are_counted_and_reported_in_the_next_window(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(logging_setup.time, "monotonic", lambda: clock[0])
+    limiter = RateLimitFilter(burst=3, interval=60.0)
+
+    passed = [limiter.filter(record("Failed to parse time")) for _ in range(10)]
+    assert passed == [True] * 3 + [False] * 7
+
+    # Other messages, levels below WARNING and critical records are not limited
+    assert limiter.filter(record("Failed to parse date"))
+    assert all(limiter.filter(record("Loading data", logging.INFO)) for _ in range(5))
+    assert all(limiter.filter(record("Failed", logging.CRITICAL)) for _ in range(5))
+
+    clock[0] += 60.0
+    next_window = record("Failed to parse time")
+    assert limiter.filter(next_window)
+    assert next_window.fields == {"suppressed": 7}
+
+    following = record("Failed to parse time")
+    assert limiter.filter(following)
+    assert not hasattr(following, "fields")
@@ -0,0 +1,94 @@
+import pandas as pd
+import pytest
+
+from src.core.room_finder import build_occupied_slots
+from src.core.schedule_index import (
+    ScheduleIndex,
+    free_rooms_near,
+    instructor_schedule_at,
+)
+from src.core.validation import validate_schedule
+from tests.conftest import load
+
+COLUMNS = [
+    "term",
+    "building",
+    "room_number",
+    "days",
+    "start_time",
+    "end_time",
+    "instructor_name",
+    "department",
+    "course_id",
+]
+RECORDS = [
+    ["20252", "5", "103", "MW", "09:30", "10:45", "Smith, Jane", "MATH", "MATH101"],
+    ["20252", "5", "104", "TR", "11:00", "12:15", " smith,  jane", "math", "MATH201"],
+    ["20251", "5", "105", "MW", "09:30", "10:45", "SMITH, JANE", "MATH", "MATH101"],
+    ["20252", "7", "110", "MW", "08:00", "09:15", "Lee, Ann", "PHYS", "PHYS101"],
+    ["20252", "7", "111", "F", "13:00", "14:15", "Lee, Ann", "PHYS", "PHYS102"],
+    ["20252", "5", "103", "TR", "08:00", "09:15", None, "MATH", "MATH300"],
+    ["20251", "7", "110", "TR", "14:00", "15:15", "Lee, Ann", "PHYS", "PHYS201"],
+    ["20252", "5", "105", "TR", "14:00", "15:15", "Lee, Ann", "MATH", "MATH310"],
+]
+
+
+def schedules():
+    """The same export validated only, and validated then compacted"""
+    export = pd.DataFrame(RECORDS, columns=COLUMNS, dtype=object)
+    validated, _, _ = validate_schedule(export)
+    compact = load(export)
+    assert isinstance(compact["instructor_name"].dtype, pd.CategoricalDtype)
+    return [validated, compact]
+
+
+def test_lookup_normalises_values_and_filters_by_term():
+    for schedule in schedules():
+        index = ScheduleIndex(schedule)
+
+        assert index.lookup("instructor_name", "smith, jane").tolist() == [0, 1, 2]
+        in_term = index.lookup("instructor_name", " SMITH,   JANE ", 20252)
+        assert in_term.tolist() == [0, 1]
+        assert index.lookup("department", "Math", 20251).tolist() == [2]
+        assert index.lookup("instructor_name", "Nobody").size == 0
+        with pytest.raises(KeyError):
+            index.lookup("division", "Science")
+
+
+def test_instructor_schedule_at():
+    for schedule in schedules():
+        index = ScheduleIndex(schedule)
+
+        sections = instructor_schedule_at(index, "Smith, Jane", 20252, "TR", "11:30")
+        assert sections == [
+            {
+                "building": 5,
+                "room": 104,
+                "course_id": "MATH201",
+                "days": "TR",
+                "start_time": "11:00",
+                "end_time": "12:15",
+            }
+        ]
+        # Meetings end at end_time, and other days or terms do not match
+        assert instructor_schedule_at(index, "smith, jane", 20252, "TR", "12:15") == []
+        assert instructor_schedule_at(index, "smith, jane", 20252, "F", "11:30") == []
+        assert instructor_schedule_at(index, "smith, jane", 20251, "TR", "11:30") == []
+
+
+def test_free_rooms_near_uses_every_room_of_the_department_buildings():
+    for schedule in schedules():
+        index = ScheduleIndex(schedule)
+        occupied = build_occupied_slots(schedule, 20252)
+        blocks = [("08:00", "09:15"), ("09:30", "10:45"), ("14:00", "15:15")]
+
+        free = free_rooms_near(index, "math", 20252, "MW", occupied, blocks)
+        assert free == {
+            ("08:00", "09:15"): [(5, 103), (5, 104), (5, 105)],
+            # Room 105 is only used in 20251 but still counts as a candidate
+            ("09:30", "10:45"): [(5, 104), (5, 105)],
+            ("14:00", "15:15"): [(5, 103), (5, 104), (5, 105)],
+        }
+        tr = free_rooms_near(index, "MATH", 20252, "TR", occupied, blocks)
+        assert tr[("08:00", "09:15")] == [(5, 104), (5, 105)]
+        assert tr[("14:00", "15:15")] == [(5, 103), (5, 104)]
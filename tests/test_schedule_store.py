@@ -0,0 +1,29 @@
+import pandas as pd
+
+from src.core.schedule_store import compact_schedule
+
+
+def test_text_codes_keep_their_spelling():
+    schedule = pd.DataFrame(
+        {
+            "term": [20252] * 4,
+            "start_min": [480, 480, 570, 570],
+            "course_id": ["0123", "01", "1e3", "01"],
+            "campus": ["01", "01", "01", "02"],
+        }
+    )
+    compact = compact_schedule(schedule)
+
+    assert compact["term"].dtype == "int16"
+    assert compact["start_min"].dtype == "int16"
+    assert compact["course_id"].tolist() == ["0123", "01", "1e3", "01"]
+    assert isinstance(compact["campus"].dtype, pd.CategoricalDtype)
+    assert compact["campus"].tolist() == ["01", "01", "01", "02"]
+
+
+def test_missing_value_does_not_change_the_column_type():
+    full = compact_schedule(pd.DataFrame({"reference_number": ["1", "2", "3"]}))
+    gap = compact_schedule(pd.DataFrame({"reference_number": ["1", None, "3"]}))
+
+    assert full["reference_number"].dtype == gap["reference_number"].dtype
+    assert gap["reference_number"].tolist()[::2] == ["1", "3"]
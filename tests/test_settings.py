@@ -0,0 +1,45 @@
+import json
+
+from src.core.constants.my_rooms import MY_ROOMS
+from src.core.room_finder import build_occupied_slots, vacant_rooms_from_slots
+from src.utils import settings
+from src.utils.settings import load_snapshot, save_snapshot
+from tests.conftest import load, random_records
+
+
+def test_snapshot_round_trips_with_tuples(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "SNAPSHOT_FILE", tmp_path / "gui_snapshot.json")
+    records = random_records(1, 60, MY_ROOMS, ["MW", "TR"])
+    occupied_slots = build_occupied_slots(load(records), 20252)
+    results = vacant_rooms_from_slots(occupied_slots, ["M", "T"])
+    version = {"name": "export.csv", "size": 1234, "mtime": 1.5}
+
+    save_snapshot(
+        version, ["20251", "20252"], "20252", ["M", "T"], occupied_slots, results
+    )
+    snapshot = load_snapshot()
+
+    assert snapshot["data_version"] == version
+    assert snapshot["terms"] == ["20251", "20252"]
+    assert snapshot["term"] == "20252"
+    assert snapshot["days"] == ["M", "T"]
+    assert snapshot["grid"] is None
+    assert snapshot["occupied_slots"] == occupied_slots
+    assert snapshot["results"] == results
+
+
+def test_snapshot_from_another_format_is_ignored(tmp_path, monkeypatch):
+    snapshot_file = tmp_path / "gui_snapshot.json"
+    monkeypatch.setattr(settings, "SNAPSHOT_FILE", snapshot_file)
+    assert load_snapshot() is None
+
+    save_snapshot({}, [], "20252", ["M"], {}, {}, "standard")
+    assert load_snapshot()["grid"] == "standard"
+
+    snapshot = json.loads(snapshot_file.read_text())
+    snapshot["format"] = settings.SNAPSHOT_FORMAT + 1
+    snapshot_file.write_text(json.dumps(snapshot))
+    assert load_snapshot() is None
+
+    snapshot_file.write_text("{not json")
+    assert load_snapshot() is None
@@ -0,0 +1,73 @@
+import pandas as pd
+
+from src.core.validation import validate_schedule, write_quarantine
+
+COLUMNS = ["term", "building", "room_number", "days", "start_time", "end_time"]
+
+
+def make_export(rows):
+    return pd.DataFrame(rows, columns=COLUMNS, dtype=object)
+
+
+def test_clean_rows_are_typed():
+    clean, rejected, counts = validate_schedule(
+        make_export(
+            [
+                ["20252", "5", "103", "mw", " 9:30", "10:45"],
+                ["20252", "15", "103", "TR", "08:00", "09:15"],
+            ]
+        )
+    )
+
+    assert rejected.empty and counts == {}
+    assert clean["term"].tolist() == [20252, 20252]
+    assert clean["building"].tolist() == [5, 15]
+    assert clean["days"].tolist() == ["MW", "TR"]
+    assert clean["start_min"].tolist() == [570, 480]
+    assert clean["end_min"].tolist() == [645, 555]
+    assert clean["start_time"].tolist() == ["09:30", "08:00"]
+
+
+def test_each_failing_check_is_counted_and_recorded():
+    clean, rejected, counts = validate_schedule(
+        make_export(
+            [
+                ["20252", "5", "103", "MW", "09:30", "10:45"],
+                ["20252", "TBA", "103", "MW", "09:30", "10:45"],
+                ["20252", "5", None, "MW", "09:30", "10:45"],
+                ["20252", "5", "103", "135", "09:30", "10:45"],
+                ["20252", "5", "103", "MX", "09:30", "10:45"],
+                ["20252", "5", "103", "MW", "9h30", "10:45"],
+                ["20252", "5", "103", "MW", "11:00", "10:45"],
+                ["20252", "5", "1e2", "MW", "09:30", "10:45"],
+                ["2025.2", "5", "-103", "MW", "09:30", "10:45"],
+                ["x", "TBA", "103", "MW", "09:30", "10:45"],
+            ]
+        )
+    )
+
+    assert len(clean) == 1
+    assert counts == {
+        "term is missing or not an integer": 2,
+        "building is missing or not numeric": 2,
+        "room number is missing or not an integer": 3,
+        "days is numeric": 1,
+        "days is missing or has invalid day codes": 1,
+        "start time is missing or malformed": 1,
+        "start time is not before end time": 1,
+    }
+    assert rejected["reasons"].iloc[-1] == (
+        "term is missing or not an integer; building is missing or not numeric"
+    )
+
+
+def test_quarantine_files_are_removed_once_the_export_is_clean(tmp_path):
+    dirty = make_export([["20252", "TBA", "103", "MW", "09:30", "10:45"]])
+    _, rejected, counts = validate_schedule(dirty)
+    quarantine_file = write_quarantine(rejected, counts, "export.csv", tmp_path)
+    assert quarantine_file.exists()
+
+    fixed = make_export([["20252", "5", "103", "MW", "09:30", "10:45"]])
+    _, rejected, counts = validate_schedule(fixed)
+    assert write_quarantine(rejected, counts, "export.csv", tmp_path) is None
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,57 @@
+from src.core.what_if import WhatIfSession
+from tests.conftest import load, random_records
+
+ROOMS = [(5, 103), (5, 104), (5, 105)]
+
+
+def section(reference, room, days, start, end):
+    return {
+        "term": "20252",
+        "building": "5",
+        "room_number": str(room),
+        "days": days,
+        "start_time": start,
+        "end_time": end,
+        "reference_number": reference,
+    }
+
+
+def test_staged_changes_match_a_rebuild():
+    records = random_records(
+        1, 60, ROOMS, ["MW", "TR", "F"], step=30, first_reference=1
+    )
+    session = WhatIfSession(load(records), 20252, ROOMS)
+
+    session.cancel_section("3")
+    session.move_section(7, room=105, start="12:00", end="13:15")
+    session.add_section("new", 5, 104, "MW", "10:00", "11:15")
+
+    expected = [dict(r) for r in records if r["reference_number"] != "3"]
+    for record in expected:
+        if record["reference_number"] == "7":
+            record.update(room_number="105", start_time="12:00", end_time="13:15")
+    expected.append(section("new", 104, "MW", "10:00", "11:15"))
+
+    rebuilt = WhatIfSession(load(expected), 20252, ROOMS)
+    assert session.vacant_rooms(list("MTWRF")) == rebuilt.vacant_rooms(list("MTWRF"))
+
+    for _ in range(3):
+        session.undo()
+    original = WhatIfSession(load(records), 20252, ROOMS)
+    assert session.vacant_rooms(list("MTWRF")) == original.vacant_rooms(list("MTWRF"))
+
+
+def test_references_match_when_one_is_missing():
+    schedule = load(
+        [
+            section("1", 103, "MW", "08:00", "09:15"),
+            section("2", 104, "MW", "08:00", "09:15"),
+            section(None, 105, "MW", "08:00", "09:15"),
+        ]
+    )
+    session = WhatIfSession(schedule, 20252, ROOMS)
+
+    # The what-if window passes text, scripts may pass integers
+    assert session.cancel_section("1")
+    assert session.move_section(2, room=103)
+    assert len(session.sections) == 2